@@ -54,6 +54,13 @@ setup(
         'compression': [
             'brotli>=1.0',
         ],
+        'performance': [
+            'numpy>=1.17',
+        ],
+        'jit': [
+            'numpy>=1.17',
+            'numba>=0.50',
+        ],
     },
     
     entry_points={
@@ -0,0 +1,42 @@
+# tests/test_parser.py
+"""
+Parser Tests
+
+Checks that schema-specialized row parsing matches the generic path.
+"""
+
+import unittest
+
+from vson.parser import VSONParser
+from vson.schema import VSONSchema
+
+
+TIMESERIES_VSON = """\
+series: demo
+
+snapshots[3]{timestamp, value}:
+
+1700000000,100.5
+1700000060,100.75
+2023-10-19T09:15:00,101.25
+"""
+
+
+class TestSpecializedRowParser(unittest.TestCase):
+    """Specialized row parsers against the generic _infer_type path"""
+    
+    def test_timeseries_parity(self):
+        parser = VSONParser(VSONSchema.timeseries_schema())
+        specialized = parser.parse(TIMESERIES_VSON)
+        generic = VSONParser().parse(TIMESERIES_VSON)
+        
+        self.assertIsNotNone(parser._row_parsers[('timestamp', 'value')])
+        self.assertEqual(specialized, generic)
+        
+        rows = specialized['snapshots']
+        self.assertIs(type(rows[0]['timestamp']), int)
+        self.assertEqual(rows[2]['timestamp'], '2023-10-19T09:15:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
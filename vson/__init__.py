@@ -18,6 +18,7 @@ __license__ = "MIT"
 from . import config
 from . import exceptions
 from . import schema
+from . import records
 from . import parser
 from . import encoder
 from . import core
@@ -33,12 +34,14 @@ from . import serializers
 from . import cli
 
 # Export main functions
-from .core import smart_encode, smart_decode, VSONSmart
+from .core import smart_encode, smart_decode, smart_encode_stream, smart_peek, VSONSmart
 
 __all__ = [
     # Core API
     "smart_encode",
     "smart_decode",
+    "smart_encode_stream",
+    "smart_peek",
     "VSONSmart",
     
     # Schema
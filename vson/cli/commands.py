@@ -6,32 +6,58 @@ Helper functions for CLI commands.
 """
 
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 
+def _supports_emoji(stream) -> bool:
+    """Check if a stream is a UTF-8 terminal"""
+    encoding = (getattr(stream, 'encoding', None) or '').lower()
+    try:
+        is_tty = stream.isatty()
+    except (AttributeError, ValueError):
+        is_tty = False
+    return encoding.startswith('utf') and is_tty
+
+
+_USE_EMOJI = _supports_emoji(sys.stdout)
+
+
 class CLIFormatter:
-    """Format output for CLI"""
+    """
+    Format output for CLI
+    
+    Status prefixes are emoji on UTF-8 terminals and plain ASCII tags
+    otherwise (pipes, log files, non-UTF-8 consoles). Prefixes are chosen
+    once at import time and each message is written with a single
+    stream.write() call.
+    """
+    
+    _SUCCESS = "\u2705 " if _USE_EMOJI else "[OK] "
+    _ERROR = "\u274c " if _USE_EMOJI else "[ERROR] "
+    _WARNING = "\u26a0\ufe0f  " if _USE_EMOJI else "[WARN] "
+    _INFO = "\u2139\ufe0f  " if _USE_EMOJI else "[INFO] "
     
     @staticmethod
     def success(message: str) -> None:
         """Print success message"""
-        print(f"âœ… {message}")
+        sys.stdout.write(CLIFormatter._SUCCESS + message + "\n")
     
     @staticmethod
     def error(message: str) -> None:
         """Print error message"""
-        print(f"âŒ {message}", file=sys.stderr)
+        sys.stderr.write(CLIFormatter._ERROR + message + "\n")
     
     @staticmethod
     def warning(message: str) -> None:
         """Print warning message"""
-        print(f"âš ï¸  {message}")
+        sys.stdout.write(CLIFormatter._WARNING + message + "\n")
     
     @staticmethod
     def info(message: str) -> None:
         """Print info message"""
-        print(f"â„¹ï¸  {message}")
+        sys.stdout.write(CLIFormatter._INFO + message + "\n")
     
     @staticmethod
     def section(title: str) -> None:
@@ -52,19 +78,32 @@ class CLIFormatter:
 
 
 class ProgressBar:
-    """Simple progress bar"""
+    """Simple progress bar (redraws at most every 50ms)"""
     
     def __init__(self, total: int, prefix: str = ""):
         self.total = total
         self.current = 0
         self.prefix = prefix
+        self._last_draw = 0.0
+        self._draw_interval = 0.05
     
     def update(self, amount: int = 1) -> None:
         """Update progress"""
         self.current += amount
+        
+        # Throttle redraws; the final update always draws
+        now = time.monotonic()
+        if now - self._last_draw < self._draw_interval and self.current < self.total:
+            return
+        self._last_draw = now
+        
         percentage = (self.current / self.total) * 100
-        bar = "â–ˆ" * int(percentage / 5) + "â–‘" * (20 - int(percentage / 5))
-        print(f"{self.prefix} |{bar}| {percentage:.1f}%", end='\r')
+        filled = int(percentage / 5)
+        bar = "â–ˆ" * filled + "â–‘" * (20 - filled)
+        line = f"{self.prefix} |{bar}| {percentage:.1f}%\r"
         
         if self.current >= self.total:
-            print()
+            line += "\n"
+        
+        sys.stdout.write(line)
+        sys.stdout.flush()
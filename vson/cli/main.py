@@ -6,9 +6,14 @@ Provides command-line interface for encoding, decoding, validation, and analysis
 """
 
 import argparse
+import mmap
+import re
 import sys
 from pathlib import Path
 
+from .commands import CLIFormatter
+from ..parser import find_array_header
+
 
 def main():
     """Main CLI entry point"""
@@ -31,7 +36,7 @@ def main():
     encode_parser.add_argument('-o', '--output', help='Output VSON file')
     encode_parser.add_argument(
         '-m', '--mode',
-        choices=['default', 'incremental_a', 'delta_b', 'depth_c'],
+        choices=['default', 'incremental_a', 'delta_b', 'delta_dod', 'gorilla', 'dict', 'depth_c'],
         default='default',
         help='Encoding mode'
     )
@@ -55,7 +60,11 @@ def main():
     # =====================================================================
     validate_parser = subparsers.add_parser('validate', help='Validate VSON file')
     validate_parser.add_argument('input', help='VSON file to validate')
-    validate_parser.add_argument('-s', '--strict', action='store_true', help='Strict validation')
+    validate_parser.add_argument(
+        '-s', '--strict',
+        action='store_true',
+        help='Strict validation (parse every record instead of checking the header)'
+    )
     validate_parser.set_defaults(func=validate_command)
     
     # =====================================================================
@@ -106,6 +115,11 @@ def main():
     diff_parser = subparsers.add_parser('diff', help='Compare two files')
     diff_parser.add_argument('file1', help='First file')
     diff_parser.add_argument('file2', help='Second file')
+    diff_parser.add_argument(
+        '--content',
+        action='store_true',
+        help='Compare records by content (decodes both files)'
+    )
     diff_parser.set_defaults(func=diff_command)
     
     # Parse arguments
@@ -118,10 +132,83 @@ def main():
     try:
         args.func(args)
     except Exception as e:
-        print(f"âŒ Error: {e}", file=sys.stderr)
+        CLIFormatter.error(f"Error: {e}")
         sys.exit(1)
 
 
+# =========================================================================
+# I/O HELPERS
+# =========================================================================
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read a file through mmap
+    
+    The OS serves the pages straight from the page cache (with readahead)
+    and the content is copied once into the returned bytes, without the
+    text-mode decode step.
+    """
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+        except ValueError:
+            # Empty files cannot be mapped
+            return b''
+
+
+def _load_json(path: Path):
+    """Load a JSON file (uses orjson when installed)"""
+    raw = _read_bytes(path)
+    try:
+        import orjson
+        return orjson.loads(raw)
+    except ImportError:
+        import json
+        return json.loads(raw)
+
+
+# Newline starting a blank or comment line (not a data row)
+_SKIPPED_LINE_RE = re.compile(rb'\n[ \t\r]*(?=[\n#])')
+
+
+def _scan_array(path: Path):
+    """
+    Read the first array header of a VSON file and count its data rows
+    
+    The file is mapped; rows up to the next array header are counted from
+    their newlines, minus blank and comment lines, without being parsed.
+    
+    Returns:
+        Tuple of (array_name, declared_count, field_names, row_count), or
+        None if the file has no array header
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+    
+    with mm:
+        header = find_array_header(mm)
+        if header is None:
+            return None
+        
+        line_start, name, declared, fields = header
+        line_end = mm.find(b'\n', line_start)
+        if line_end == -1:
+            line_end = len(mm)
+        following = find_array_header(mm, line_end + 1)
+        rows_end = following[0] if following is not None else len(mm)
+        
+        # Each line is counted by the newline before it
+        rows = mm[line_end:rows_end].rstrip()
+        row_count = rows.count(b'\n') - len(_SKIPPED_LINE_RE.findall(rows))
+    
+    return name, declared, fields, row_count
+
+
 # =========================================================================
 # COMMAND IMPLEMENTATIONS
 # =========================================================================
@@ -138,8 +225,7 @@ def encode_command(args):
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
     # Read JSON
-    with open(input_path) as f:
-        data = json.load(f)
+    data = _load_json(input_path)
     
     # Encode
     vson.smart_encode(
@@ -154,7 +240,7 @@ def encode_command(args):
     output_size = output_path.stat().st_size
     ratio = input_size / output_size if output_size > 0 else 0
     
-    print(f"âœ… Encoded successfully")
+    CLIFormatter.success("Encoded successfully")
     print(f"   Input:  {vson.utils.format_size(input_size)}")
     print(f"   Output: {vson.utils.format_size(output_size)}")
     print(f"   Ratio:  {ratio:.2f}x smaller")
@@ -179,7 +265,7 @@ def decode_command(args):
     with open(output_path, 'w') as f:
         json.dump(data, f, indent=2)
     
-    print(f"âœ… Decoded successfully")
+    CLIFormatter.success("Decoded successfully")
     print(f"   Records: {len(data.get('snapshots', []))}")
     print(f"   Output:  {output_path}")
 
@@ -194,15 +280,28 @@ def validate_command(args):
         raise FileNotFoundError(f"File not found: {input_path}")
     
     try:
-        data = vson.smart_decode(input_path)
-        records = data.get('snapshots', [])
+        # Fast path: check the array header and its row count, without
+        # parsing the rows
+        scan = None if args.strict else _scan_array(input_path)
         
-        print(f"âœ… Valid VSON file")
-        print(f"   Records: {len(records)}")
-        print(f"   Fields:  {list(records[0].keys()) if records else []}")
+        if scan is not None and scan[0] == 'snapshots':
+            _, num_records, fields, num_rows = scan
+            if num_rows != num_records:
+                raise ValueError(
+                    f"header declares {num_records} records, found {num_rows} rows"
+                )
+        else:
+            data = vson.smart_decode(input_path)
+            records = data.get('snapshots', [])
+            num_records = len(records)
+            fields = list(records[0].keys()) if records else []
+        
+        CLIFormatter.success("Valid VSON file")
+        print(f"   Records: {num_records}")
+        print(f"   Fields:  {fields}")
         
     except Exception as e:
-        print(f"âŒ Invalid VSON file: {e}")
+        CLIFormatter.error(f"Invalid VSON file: {e}")
         sys.exit(1)
 
 
@@ -253,7 +352,7 @@ def schema_command(args):
     records = data.get('snapshots', [])
     
     if not records:
-        print("âŒ No records found")
+        CLIFormatter.error("No records found")
         return
     
     # Infer schema
@@ -274,7 +373,7 @@ def schema_command(args):
     
     if output_path:
         output_path.write_text(schema_json)
-        print(f"âœ… Schema exported to {output_path}")
+        CLIFormatter.success(f"Schema exported to {output_path}")
     else:
         print(schema_json)
 
@@ -313,7 +412,7 @@ def split_command(args):
         verbose=True
     )
     
-    print(f"âœ… Split into {len(files)} chunks")
+    CLIFormatter.success(f"Split into {len(files)} chunks")
 
 
 def benchmark_command(args):
@@ -327,11 +426,10 @@ def benchmark_command(args):
         raise FileNotFoundError(f"File not found: {input_path}")
     
     # Read data
-    with open(input_path) as f:
-        if input_path.suffix == '.json':
-            data = json.load(f)
-        else:
-            data = vson.smart_decode(input_path)
+    if input_path.suffix == '.json':
+        data = _load_json(input_path)
+    else:
+        data = vson.smart_decode(input_path)
     
     # Benchmark encode
     encode_stats = vson.utils.profile_encode(data, args.iterations)
@@ -365,7 +463,8 @@ def diff_command(args):
         raise FileNotFoundError(f"File not found: {file2}")
     
     # Diff
-    diff = vson.utils.diff_files(file1, file2, verbose=True)
+    mode = "content" if args.content else "count"
+    diff = vson.utils.diff_files(file1, file2, verbose=True, mode=mode)
     
     print(f"\nðŸ“Š Comparison Results")
     print(f"   File 1: {diff['records_file1']} records")
@@ -0,0 +1,574 @@
+# vson/codecs.py
+"""
+VSON Binary Codecs
+
+Compact bit-level encodings used by the columnar encoding modes:
+- Bit stream reader/writer
+- Zig-zag and LEB128 varint integers
+- Delta-of-delta timestamps (Gorilla style)
+- XOR-compressed floats (Gorilla style)
+- Dictionary encoding for low-cardinality columns
+"""
+
+from typing import Any, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+# =========================================================================
+# BIT STREAMS
+# =========================================================================
+
+class BitWriter:
+    """
+    Append-only bit stream (most significant bit first)
+
+    Example:
+        writer = BitWriter()
+        writer.write(0b10, 2)
+        data = writer.getvalue()
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+        self._acc = 0
+        self._nbits = 0
+
+    def write(self, value: int, nbits: int) -> None:
+        """
+        Append the lowest `nbits` bits of value
+
+        Args:
+            value: Non-negative integer
+            nbits: Number of bits to write
+        """
+        self._acc = (self._acc << nbits) | (value & ((1 << nbits) - 1))
+        self._nbits += nbits
+
+        while self._nbits >= 8:
+            self._nbits -= 8
+            self._buf.append((self._acc >> self._nbits) & 0xFF)
+
+        self._acc &= (1 << self._nbits) - 1
+
+    def getvalue(self) -> bytes:
+        """Return written bits, zero-padded to a whole byte"""
+        if self._nbits:
+            return bytes(self._buf) + bytes([(self._acc << (8 - self._nbits)) & 0xFF])
+        return bytes(self._buf)
+
+
+class BitReader:
+    """
+    Sequential reader for streams produced by BitWriter
+
+    Example:
+        reader = BitReader(data)
+        flag = reader.read(2)
+    """
+
+    def __init__(self, data: bytes, pos: int = 0):
+        """
+        Initialize reader
+
+        Args:
+            data: Encoded bytes
+            pos: Byte offset where the bit stream starts
+        """
+        self._data = data
+        self._pos = pos
+        self._acc = 0
+        self._nbits = 0
+
+    def read(self, nbits: int) -> int:
+        """
+        Read `nbits` bits as an unsigned integer
+
+        Raises:
+            ValueError: If the stream ends early
+        """
+        while self._nbits < nbits:
+            if self._pos >= len(self._data):
+                raise ValueError("Bit stream exhausted")
+            self._acc = (self._acc << 8) | self._data[self._pos]
+            self._pos += 1
+            self._nbits += 8
+
+        self._nbits -= nbits
+        value = self._acc >> self._nbits
+        self._acc &= (1 << self._nbits) - 1
+        return value
+
+
+# =========================================================================
+# INTEGER ENCODINGS
+# =========================================================================
+
+def zigzag_encode(value: int) -> int:
+    """Map signed to unsigned integers (0, -1, 1, -2 -> 0, 1, 2, 3)"""
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def zigzag_decode(value: int) -> int:
+    """Inverse of zigzag_encode"""
+    return (value >> 1) ^ -(value & 1)
+
+
+def write_varint(buf: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint"""
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """
+    Read an unsigned LEB128 varint
+
+    Returns:
+        Tuple of (value, next_position)
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# =========================================================================
+# DELTA-OF-DELTA TIMESTAMPS
+# =========================================================================
+
+# (prefix, prefix_bits, value_bits) buckets for zig-zagged delta-of-deltas;
+# a zero delta-of-delta is a single '0' bit
+_DOD_BUCKETS = (
+    (0b10, 2, 7),
+    (0b110, 3, 9),
+    (0b1110, 4, 12),
+    (0b1111, 4, 64),
+)
+
+
+def encode_timestamps_dod(timestamps: Sequence[int]) -> bytes:
+    """
+    Encode integer timestamps with delta-of-delta compression
+
+    Layout: varint count, zig-zag varint first timestamp, zig-zag varint
+    first delta, then one bit-packed entry per remaining timestamp. Evenly
+    spaced series encode to one bit per timestamp.
+
+    Args:
+        timestamps: Integer timestamps (any unit)
+
+    Returns:
+        Encoded bytes
+
+    Raises:
+        ValueError: If a delta-of-delta does not fit in 64 bits
+    """
+    count = len(timestamps)
+    header = bytearray()
+    write_varint(header, count)
+
+    if count == 0:
+        return bytes(header)
+
+    write_varint(header, zigzag_encode(int(timestamps[0])))
+    if count == 1:
+        return bytes(header)
+
+    write_varint(header, zigzag_encode(int(timestamps[1]) - int(timestamps[0])))
+
+    # int64 arithmetic is exact while the series spans less than 2**61
+    if np is not None and max(timestamps) - min(timestamps) < (1 << 61):
+        dd = np.diff(np.asarray(timestamps, dtype=np.int64), n=2)
+        zigzagged = ((dd << 1) ^ (dd >> 63)).view(np.uint64).tolist()
+    else:
+        ts = [int(t) for t in timestamps]
+        zigzagged = [
+            zigzag_encode((ts[i] - ts[i - 1]) - (ts[i - 1] - ts[i - 2]))
+            for i in range(2, count)
+        ]
+
+    writer = BitWriter()
+    for zz in zigzagged:
+        if zz == 0:
+            writer.write(0, 1)
+            continue
+        for prefix, prefix_bits, value_bits in _DOD_BUCKETS:
+            if zz < (1 << value_bits):
+                writer.write(prefix, prefix_bits)
+                writer.write(zz, value_bits)
+                break
+        else:
+            raise ValueError(f"Delta-of-delta out of range: {zigzag_decode(zz)}")
+
+    return bytes(header) + writer.getvalue()
+
+
+def decode_timestamps_dod(data: bytes) -> List[int]:
+    """
+    Decode timestamps produced by encode_timestamps_dod
+
+    Args:
+        data: Encoded bytes
+
+    Returns:
+        List of integer timestamps
+    """
+    count, pos = read_varint(data, 0)
+    if count == 0:
+        return []
+
+    zz, pos = read_varint(data, pos)
+    current = zigzag_decode(zz)
+    timestamps = [current]
+    if count == 1:
+        return timestamps
+
+    zz, pos = read_varint(data, pos)
+    delta = zigzag_decode(zz)
+    current += delta
+    timestamps.append(current)
+
+    reader = BitReader(data, pos)
+    for _ in range(count - 2):
+        if reader.read(1):
+            if not reader.read(1):
+                value_bits = 7
+            elif not reader.read(1):
+                value_bits = 9
+            elif not reader.read(1):
+                value_bits = 12
+            else:
+                value_bits = 64
+            delta += zigzag_decode(reader.read(value_bits))
+        current += delta
+        timestamps.append(current)
+
+    return timestamps
+
+
+# =========================================================================
+# TIMESTAMP VALUES
+# =========================================================================
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+_TIMESPECS = {0: 'seconds', 3: 'milliseconds', 6: 'microseconds'}
+
+
+def _format_offset(offset: Optional[timedelta]) -> str:
+    """Format a UTC offset as +HH:MM (or 'none' for naive timestamps)"""
+    if offset is None:
+        return 'none'
+    minutes = int(offset.total_seconds()) // 60
+    sign = '+' if minutes >= 0 else '-'
+    minutes = abs(minutes)
+    return f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def _parse_offset(text: str) -> Optional[timezone]:
+    """Inverse of _format_offset"""
+    if text == 'none':
+        return None
+    sign = -1 if text[0] == '-' else 1
+    hours, minutes = text[1:].split(':')
+    return timezone(sign * timedelta(hours=int(hours), minutes=int(minutes)))
+
+
+def ints_to_timestamps(values: List[int], fmt: str) -> List[Any]:
+    """
+    Convert integers back to timestamps described by `fmt`
+
+    Args:
+        values: Integer timestamps
+        fmt: Format descriptor from timestamps_to_ints
+
+    Returns:
+        List of timestamps (ints or ISO 8601 strings)
+    """
+    if fmt == 'int':
+        return list(values)
+
+    _, timespec, offset = fmt.split(';')
+    tz = _parse_offset(offset)
+
+    if tz is None:
+        return [
+            (_EPOCH + v * _MICROSECOND).isoformat(timespec=timespec)
+            for v in values
+        ]
+
+    return [
+        (_EPOCH_UTC + v * _MICROSECOND).astimezone(tz).isoformat(timespec=timespec)
+        for v in values
+    ]
+
+
+def timestamps_to_ints(values: Sequence[Any]) -> Optional[Tuple[List[int], str]]:
+    """
+    Convert timestamps to integers for delta-of-delta encoding
+
+    Integer timestamps are used as-is. ISO 8601 strings become microseconds
+    since the epoch; they must share one UTC offset and one fractional
+    precision so the exact strings can be rebuilt.
+
+    Args:
+        values: Timestamps (ints or ISO 8601 strings)
+
+    Returns:
+        Tuple of (integers, format descriptor), or None if the values cannot
+        be converted losslessly
+    """
+    if not values:
+        return None
+
+    if all(type(v) is int for v in values):
+        return list(values), 'int'
+
+    if not all(isinstance(v, str) for v in values):
+        return None
+
+    first = values[0]
+    t_pos = first.find('T')
+    if t_pos == -1:
+        return None
+
+    # Fractional second digits decide the rebuild precision
+    dot = first.find('.', t_pos)
+    digits = 0
+    if dot != -1:
+        end = dot + 1
+        while end < len(first) and first[end].isdigit():
+            end += 1
+        digits = end - dot - 1
+
+    timespec = _TIMESPECS.get(digits)
+    if timespec is None:
+        return None
+
+    try:
+        parsed = [datetime.fromisoformat(v) for v in values]
+    except ValueError:
+        return None
+
+    offset = parsed[0].utcoffset()
+    if any(dt.utcoffset() != offset for dt in parsed):
+        return None
+
+    if offset is None:
+        ints = [(dt - _EPOCH) // _MICROSECOND for dt in parsed]
+    else:
+        ints = [(dt - _EPOCH_UTC) // _MICROSECOND for dt in parsed]
+
+    fmt = f"iso;{timespec};{_format_offset(offset)}"
+
+    # Only accept formats that round-trip exactly
+    if ints_to_timestamps(ints, fmt) != list(values):
+        return None
+
+    return ints, fmt
+
+
+def pack_timestamps(values: Sequence[Any]) -> Optional[Tuple[str, bytes]]:
+    """
+    Encode a timestamp column with delta-of-delta compression
+
+    Args:
+        values: Timestamps (ints or ISO 8601 strings)
+
+    Returns:
+        Tuple of (format descriptor, encoded bytes), or None if the column
+        cannot be encoded losslessly
+    """
+    converted = timestamps_to_ints(values)
+    if converted is None:
+        return None
+
+    ints, fmt = converted
+    try:
+        return fmt, encode_timestamps_dod(ints)
+    except (ValueError, OverflowError):
+        return None
+
+
+def unpack_timestamps(fmt: str, data: bytes) -> List[Any]:
+    """Decode a timestamp column produced by pack_timestamps"""
+    return ints_to_timestamps(decode_timestamps_dod(data), fmt)
+
+
+# =========================================================================
+# GORILLA FLOATS
+# =========================================================================
+
+def _float_words(values: Sequence[float]) -> List[int]:
+    """Reinterpret floats as their IEEE 754 64-bit patterns"""
+    if np is not None:
+        return np.asarray(values, dtype=np.float64).view(np.uint64).tolist()
+    count = len(values)
+    return list(struct.unpack(f'<{count}Q', struct.pack(f'<{count}d', *values)))
+
+
+def _word_floats(words: List[int]) -> List[float]:
+    """Inverse of _float_words"""
+    if np is not None:
+        return np.array(words, dtype=np.uint64).view(np.float64).tolist()
+    count = len(words)
+    return list(struct.unpack(f'<{count}d', struct.pack(f'<{count}Q', *words)))
+
+
+def encode_floats_gorilla(values: Sequence[float]) -> bytes:
+    """
+    Encode floats with Gorilla XOR compression
+
+    Each value is XORed with its predecessor. Control bits per value:
+    '0' repeat, '10' meaningful bits fit the previous window, '11' new
+    window (5-bit leading zeros, 6-bit length, then the bits). Slowly
+    changing prices mostly cost one or two bits.
+
+    Args:
+        values: Float values (ints are stored as floats)
+
+    Returns:
+        Encoded bytes
+    """
+    header = bytearray()
+    write_varint(header, len(values))
+    if not values:
+        return bytes(header)
+
+    words = _float_words(values)
+
+    writer = BitWriter()
+    writer.write(words[0], 64)
+
+    window_lead = window_trail = -1
+    prev = words[0]
+    for word in words[1:]:
+        xor = word ^ prev
+        prev = word
+
+        if xor == 0:
+            writer.write(0, 1)
+            continue
+
+        lead = min(64 - xor.bit_length(), 31)
+        trail = (xor & -xor).bit_length() - 1
+
+        if window_lead >= 0 and lead >= window_lead and trail >= window_trail:
+            writer.write(0b10, 2)
+            writer.write(xor >> window_trail, 64 - window_lead - window_trail)
+        else:
+            length = 64 - lead - trail
+            writer.write(0b11, 2)
+            writer.write(lead, 5)
+            writer.write(length - 1, 6)
+            writer.write(xor >> trail, length)
+            window_lead, window_trail = lead, trail
+
+    return bytes(header) + writer.getvalue()
+
+
+def decode_floats_gorilla(data: bytes) -> List[float]:
+    """
+    Decode floats produced by encode_floats_gorilla
+
+    Args:
+        data: Encoded bytes
+
+    Returns:
+        List of floats
+    """
+    count, pos = read_varint(data, 0)
+    if count == 0:
+        return []
+
+    reader = BitReader(data, pos)
+    prev = reader.read(64)
+    words = [prev]
+
+    window_lead = window_trail = 0
+    for _ in range(count - 1):
+        if reader.read(1):
+            if reader.read(1):
+                window_lead = reader.read(5)
+                window_trail = 64 - window_lead - (reader.read(6) + 1)
+            prev ^= reader.read(64 - window_lead - window_trail) << window_trail
+        words.append(prev)
+
+    return _word_floats(words)
+
+
+# =========================================================================
+# DICTIONARY ENCODING
+# =========================================================================
+
+def dictionary_encode(
+    values: Sequence[Any],
+    max_size: int = 256
+) -> Optional[Tuple[List[Any], List[int]]]:
+    """
+    Dictionary-encode a column as distinct values plus integer codes
+
+    Typed int/float columns are built with np.unique (sorted dictionary);
+    other columns keep first-seen order. Values of different types never
+    share an entry (1, 1.0 and True stay distinct).
+
+    Args:
+        values: Column values (hashable scalars)
+        max_size: Largest dictionary accepted (256 fits codes in a byte)
+
+    Returns:
+        Tuple of (dictionary, codes), or None if there are more than
+        max_size distinct values or a value is unhashable
+    """
+    kinds = {type(v) for v in values}
+
+    if np is not None and values and (kinds == {int} or kinds == {float}):
+        try:
+            column = np.asarray(values, dtype=np.int64 if kinds == {int} else np.float64)
+        except OverflowError:
+            column = None
+
+        # np.unique merges NaNs, which the dict path keeps apart
+        if column is not None and not (kinds == {float} and np.isnan(column).any()):
+            uniques, codes = np.unique(column, return_inverse=True)
+            if len(uniques) > max_size:
+                return None
+            return uniques.tolist(), codes.ravel().tolist()
+
+    index = {}
+    dictionary = []
+    codes = []
+
+    try:
+        for value in values:
+            key = (type(value), value)
+            code = index.get(key)
+            if code is None:
+                if len(dictionary) >= max_size:
+                    return None
+                code = index[key] = len(dictionary)
+                dictionary.append(value)
+            codes.append(code)
+    except TypeError:
+        return None
+
+    return dictionary, codes
+
+
+def dictionary_decode(dictionary: List[Any], codes: Sequence[int]) -> List[Any]:
+    """Inverse of dictionary_encode"""
+    return [dictionary[code] for code in codes]
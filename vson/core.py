@@ -5,22 +5,36 @@ VSON Core Module - Smart Single-Function Interface
 This is the main API providing:
 - smart_encode() - Unified encoding for all modes
 - smart_decode() - Unified decoding with auto-detection
-- Four modes: default, incremental_a, delta_b, depth_c
+- smart_encode_stream() - Incremental writer for large outputs
+- smart_peek() - Record count and first record without a full decode
+- Modes: default, incremental_a, delta_b, delta_dod, gorilla, dict, depth_c
 """
 
-from typing import Dict, Any, Optional, List, Union, Iterator
+from typing import Dict, Any, Optional, List, Union, Iterator, Iterable, Tuple
 from pathlib import Path
 from enum import Enum
 from datetime import datetime
+import base64
 import json
+import mmap
+import os
+import re
 
 from .encoder import VSONEncoder, DeltaEncoder
-from .parser import VSONParser, StreamingVSONParser
+from .parser import VSONParser, StreamingVSONParser, RawArray
 from .schema import VSONSchema
 from .exceptions import (
     VSONError, VSONEncodingError, VSONParseError, VSONIOError
 )
 from .config import Config
+from . import codecs
+
+
+# snapshots array header on its own line: snapshots[count]{fields}:
+_SNAPSHOTS_HEADER_RE = re.compile(rb'^[ \t]*snapshots\[(\d+)\]\{([^}]*)\}', re.M)
+
+# Modes whose snapshots rows do not hold complete records
+_PACKED_MODE_RE = re.compile(rb'^# Mode: (?:delta_b|delta_dod|gorilla|dict)\b', re.M)
 
 
 class EncodingMode(Enum):
@@ -28,6 +42,9 @@ class EncodingMode(Enum):
     DEFAULT = "default"              # All features
     INCREMENTAL_A = "incremental_a"  # Append to file
     DELTA_B = "delta_b"              # Delta compression
+    DELTA_DOD = "delta_dod"          # Delta compression, packed timestamps
+    GORILLA = "gorilla"              # XOR-compressed float columns
+    DICT = "dict"                    # Dictionary-coded repetitive columns
     DEPTH_C = "depth_c"              # Depth embedding
 
 
@@ -57,6 +74,9 @@ class VSONSmart:
         - default: All features (incremental + delta + depth)
         - incremental_a: Append to existing file
         - delta_b: Delta compression (base + deltas)
+        - delta_dod: Delta compression with delta-of-delta packed timestamps
+        - gorilla: XOR-compressed float columns (option gorilla_fields)
+        - dict: Dictionary-coded low-cardinality columns (option dict_fields)
         - depth_c: Full depth embedding
         """
         
@@ -77,6 +97,12 @@ class VSONSmart:
             vson_str = self._encode_incremental(data_list, filepath, **options)
         elif mode == "delta_b":
             vson_str = self._encode_delta(data_list, **options)
+        elif mode == "delta_dod":
+            vson_str = self._encode_delta_dod(data_list, **options)
+        elif mode == "gorilla":
+            vson_str = self._encode_gorilla(data_list, **options)
+        elif mode == "dict":
+            vson_str = self._encode_dict(data_list, **options)
         elif mode == "depth_c":
             vson_str = self._encode_with_depth(data_list, **options)
         else:
@@ -103,7 +129,7 @@ class VSONSmart:
         if isinstance(source, dict):
             return source
         
-        if isinstance(source, Path) or (isinstance(source, str) and '\\n' not in source and not source.startswith('[')):
+        if isinstance(source, Path) or (isinstance(source, str) and '\n' not in source and not source.startswith('[')):
             # File path
             vson_str = Path(source).read_text(encoding='utf-8')
             detected_mode = self._detect_mode(vson_str)
@@ -121,6 +147,12 @@ class VSONSmart:
         # Route to handler
         if final_mode == "delta_b":
             return self._decode_delta(vson_str, **options)
+        elif final_mode == "delta_dod":
+            return self._decode_delta_dod(vson_str, **options)
+        elif final_mode == "gorilla":
+            return self._decode_gorilla(vson_str, **options)
+        elif final_mode == "dict":
+            return self._decode_dict(vson_str, **options)
         elif final_mode == "depth_c":
             return self._decode_with_depth(vson_str, **options)
         elif final_mode == "incremental_a":
@@ -128,6 +160,58 @@ class VSONSmart:
         else:
             return self._decode_default(vson_str, **options)
     
+    def smart_peek(self, filepath: Union[str, Path]) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """
+        Read the record count and first record without decoding the file
+        
+        The file is memory-mapped; the count comes from the snapshots array
+        header and only the first row is parsed. Delta, gorilla and dict
+        files store records across several sections and are decoded lazily
+        instead.
+        
+        Args:
+            filepath: VSON file path
+        
+        Returns:
+            Tuple of (record_count, first_record or None)
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0, None
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                match = _SNAPSHOTS_HEADER_RE.search(mm)
+                if match is not None and not _PACKED_MODE_RE.search(mm, 0, match.start()):
+                    count = int(match.group(1))
+                    fields = [f.strip() for f in match.group(2).decode('utf-8').split(',')]
+                    return count, self._peek_first_row(mm, mm.find(b'\n', match.end()), fields)
+        
+        data = self.smart_decode(Path(filepath), lazy=True)
+        snapshots = data.get("snapshots", []) if isinstance(data, dict) else []
+        return len(snapshots), next(iter(snapshots), None)
+    
+    def _peek_first_row(
+        self,
+        buf: mmap.mmap,
+        pos: int,
+        fields: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse the first data row after an array header ending at pos"""
+        comment = Config.COMMENT_CHAR
+        
+        while pos != -1:
+            start = pos + 1
+            pos = buf.find(b'\n', start)
+            line = buf[start:pos if pos != -1 else len(buf)].decode('utf-8').strip()
+            
+            if not line or line.startswith(comment):
+                continue
+            if self.parser._is_array_definition(line):
+                return None
+            return self.parser._row_to_dict(line, fields, self.parser._get_row_parser(fields))
+        
+        return None
+    
     # =====================================================================
     # MODE IMPLEMENTATIONS
     # =====================================================================
@@ -207,53 +291,253 @@ class VSONSmart:
         if not data_list:
             raise VSONEncodingError("No data for delta encoding")
         
+        return self._encode_delta_sections(
+            data_list, ["# DELTA COMPRESSION MODE"], keep_timestamps=True
+        )
+    
+    def _encode_delta_dod(self, data_list: List[Dict], **options) -> str:
+        """
+        DELTA_DOD: Delta compression with packed timestamps
+        
+        Timestamps are removed from the delta rows and stored once as a
+        base64 delta-of-delta stream (see vson.codecs). Falls back to
+        delta_b when the timestamps cannot be packed losslessly.
+        """
+        
+        if not data_list:
+            raise VSONEncodingError("No data for delta encoding")
+        
+        packed = None
+        if all("timestamp" in record for record in data_list):
+            packed = codecs.pack_timestamps([record["timestamp"] for record in data_list])
+        
+        if packed is None or not any(f != "timestamp" for f in data_list[0]):
+            return self._encode_delta(data_list, **options)
+        
+        ts_format, ts_bytes = packed
+        mode_lines = [
+            "# Mode: delta_dod",
+            f"ts_codec: {ts_format}",
+            f"ts_data: {base64.b64encode(ts_bytes).decode('ascii')}",
+        ]
+        return self._encode_delta_sections(data_list, mode_lines, keep_timestamps=False)
+    
+    def _encode_delta_sections(
+        self,
+        data_list: List[Dict],
+        mode_lines: List[str],
+        keep_timestamps: bool
+    ) -> str:
+        """
+        Write the metadata, base record and delta rows of a delta mode
+        
+        delta_b and delta_dod differ only in the timestamp column: delta_b
+        keeps it in the base and delta rows, delta_dod drops it and packs
+        the timestamps into its mode lines.
+        
+        Args:
+            data_list: Records to encode (at least one)
+            mode_lines: Header lines written after the metadata
+            keep_timestamps: Write timestamps as a regular column
+        
+        Returns:
+            VSON string
+        """
+        serialize = self.encoder._serialize_value
+        
+        base = data_list[0]
+        base_fields = [f for f in base.keys() if keep_timestamps or f != "timestamp"]
+        value_fields = [f for f in base_fields if f != "timestamp"]
+        
         lines = []
         
         # Metadata
-        metadata = self._extract_metadata(data_list[0])
+        metadata = self._extract_metadata(base)
         for key, value in metadata.items():
             lines.append(f"{key}: {value}")
         lines.append("")
-        lines.append("# DELTA COMPRESSION MODE")
+        lines.extend(mode_lines)
         lines.append("")
         
         # Base snapshot
-        base = data_list[0]
-        base_fields = list(base.keys())
-        base_field_str = ", ".join(base_fields)
-        
-        lines.append(f"base{{{base_field_str}}}:")
-        values = [self.encoder._serialize_value(base.get(f, "")) for f in base_fields]
-        lines.append(",".join(values))
+        lines.append(f"base{{{', '.join(base_fields)}}}:")
+        lines.append(",".join(serialize(base.get(f, "")) for f in base_fields))
         lines.append("")
         
-        # Deltas
+        # Deltas (rows follow the header directly)
         if len(data_list) > 1:
-            delta_fields = ["timestamp"] + [f"delta_{f}" for f in base_fields if f != "timestamp"]
-            delta_field_str = ", ".join(delta_fields)
-            
-            lines.append(f"deltas[{len(data_list) - 1}]{{{delta_field_str}}}:")
-            lines.append("")
+            delta_fields = [f"delta_{f}" for f in value_fields]
+            if keep_timestamps:
+                delta_fields.insert(0, "timestamp")
+            lines.append(f"deltas[{len(data_list) - 1}]{{{', '.join(delta_fields)}}}:")
             
             for i in range(1, len(data_list)):
                 current = data_list[i]
                 previous = data_list[i - 1]
                 
-                delta_record = {}
-                delta_record["timestamp"] = current.get("timestamp", "")
-                
-                for field in base_fields:
-                    if field != "timestamp":
-                        curr_val = current.get(field, 0)
-                        prev_val = previous.get(field, 0)
-                        
-                        if isinstance(curr_val, (int, float)) and isinstance(prev_val, (int, float)):
-                            delta_record[f"delta_{field}"] = curr_val - prev_val
-                        else:
-                            delta_record[f"delta_{field}"] = curr_val
+                values = [serialize(current.get("timestamp", ""))] if keep_timestamps else []
+                for field in value_fields:
+                    curr_val = current.get(field, 0)
+                    prev_val = previous.get(field, 0)
+                    
+                    if isinstance(curr_val, (int, float)) and isinstance(prev_val, (int, float)):
+                        values.append(serialize(curr_val - prev_val))
+                    else:
+                        values.append(serialize(curr_val))
                 
-                delta_values = [self.encoder._serialize_value(delta_record.get(f, "")) for f in delta_fields]
-                lines.append(",".join(delta_values))
+                lines.append(",".join(values))
+        
+        return "\n".join(lines)
+    
+    def _encode_gorilla(self, data_list: List[Dict], **options) -> str:
+        """
+        GORILLA: XOR-compressed float columns
+        
+        Numeric columns are stored once each as base64 Gorilla streams (see
+        vson.codecs); all other columns stay in a regular snapshots array.
+        
+        Options:
+            gorilla_fields: Columns to compress (default: every column
+                holding floats in all records)
+        """
+        
+        fields = list(data_list[0].keys())
+        gorilla_fields = self._gorilla_columns(data_list, fields, options.get("gorilla_fields"))
+        if not gorilla_fields:
+            return self._encode_default(data_list, **options)
+        
+        lines = []
+        
+        # Metadata
+        metadata = self._extract_metadata(data_list[0])
+        for key, value in metadata.items():
+            lines.append(f"{key}: {value}")
+        lines.append("")
+        lines.append("# Mode: gorilla")
+        lines.append(f"field_order: {', '.join(fields)}")
+        
+        # Compressed columns ("i" columns are restored as ints)
+        for field in gorilla_fields:
+            column = [record[field] for record in data_list]
+            kind = "i" if all(type(v) is int for v in column) else "f"
+            payload = base64.b64encode(codecs.encode_floats_gorilla(column)).decode('ascii')
+            lines.append(f"gorilla.{field}: {kind}:{payload}")
+        lines.append("")
+        
+        # Remaining columns as rows
+        row_fields = [f for f in fields if f not in gorilla_fields]
+        if row_fields:
+            lines.append(f"snapshots[{len(data_list)}]{{{', '.join(row_fields)}}}:")
+            lines.append("")
+            
+            for record in data_list:
+                values = [self.encoder._serialize_value(record.get(f, "")) for f in row_fields]
+                lines.append(",".join(values))
+        
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _gorilla_columns(
+        data_list: List[Dict],
+        fields: List[str],
+        requested: Optional[List[str]] = None
+    ) -> List[str]:
+        """
+        Pick columns that can be Gorilla-encoded losslessly
+        
+        Args:
+            data_list: Records to encode
+            fields: Column order
+            requested: Explicit candidate columns (default: float columns)
+        
+        Returns:
+            Columns present and numeric in every record
+        """
+        candidates = fields if requested is None else [f for f in fields if f in requested]
+        
+        selected = []
+        for field in candidates:
+            column = [record.get(field) for record in data_list]
+            types = {type(v) for v in column}
+            
+            if types == {float}:
+                selected.append(field)
+            elif requested is not None and types <= {int, float}:
+                # Ints must survive the float64 round trip
+                if all(type(v) is float or abs(v) <= 2 ** 53 for v in column):
+                    selected.append(field)
+        
+        return selected
+    
+    def _encode_dict(self, data_list: List[Dict], **options) -> str:
+        """
+        DICT: Dictionary-coded low-cardinality columns
+        
+        Each selected column is written once as a JSON list of its distinct
+        values; rows then hold small integer codes into that list.
+        
+        Options:
+            dict_fields: Columns to encode (default: columns with at most
+                dict_max_size distinct values, at most half the row count)
+            dict_max_size: Largest dictionary per column (default 256)
+        """
+        
+        fields = list(data_list[0].keys())
+        requested = options.get("dict_fields")
+        max_size = options.get("dict_max_size", 256)
+        
+        dictionaries = {}
+        codes = {}
+        for field in fields:
+            if requested is not None and field not in requested:
+                continue
+            
+            encoded = codecs.dictionary_encode([r.get(field) for r in data_list], max_size)
+            if encoded is None:
+                continue
+            
+            # Unrequested columns must repeat enough to pay for the dictionary
+            if requested is None and len(encoded[0]) * 2 > len(data_list):
+                continue
+            
+            # Values that do not survive a JSON round trip stay plain
+            dictionary = encoded[0]
+            try:
+                text = json.dumps(dictionary, separators=(',', ':'))
+            except (TypeError, ValueError):
+                continue
+            restored = json.loads(text)
+            if restored != dictionary or list(map(type, restored)) != list(map(type, dictionary)):
+                continue
+            
+            dictionaries[field], codes[field] = text, encoded[1]
+        
+        if not dictionaries:
+            return self._encode_default(data_list, **options)
+        
+        serialize = self.encoder._serialize_value
+        lines = []
+        
+        # Metadata
+        metadata = self._extract_metadata(data_list[0])
+        for key, value in metadata.items():
+            lines.append(f"{key}: {value}")
+        lines.append("")
+        lines.append("# Mode: dict")
+        for field, text in dictionaries.items():
+            lines.append(f"dict.{field}: {text}")
+        lines.append("")
+        
+        # Rows (coded columns hold dictionary indices)
+        lines.append(f"snapshots[{len(data_list)}]{{{', '.join(fields)}}}:")
+        lines.append("")
+        
+        for i, record in enumerate(data_list):
+            values = [
+                str(codes[f][i]) if f in codes else serialize(record.get(f, ""))
+                for f in fields
+            ]
+            lines.append(",".join(values))
         
         return "\n".join(lines)
     
@@ -298,11 +582,11 @@ class VSONSmart:
     
     def _decode_default(self, vson_str: str, **options) -> Dict:
         """DEFAULT decode"""
-        return self.parser.parse(vson_str)
+        return self.parser.parse(vson_str, lazy=options.get("lazy", False))
     
     def _decode_incremental(self, vson_str: str, **options) -> Dict:
         """INCREMENTAL decode"""
-        return self.parser.parse(vson_str)
+        return self.parser.parse(vson_str, lazy=options.get("lazy", False))
     
     def _decode_delta(self, vson_str: str, **options) -> Dict:
         """DELTA decode - reconstruct from deltas"""
@@ -359,9 +643,87 @@ class VSONSmart:
         
         return {"snapshots": snapshots}
     
+    def _decode_delta_dod(self, vson_str: str, **options) -> Dict:
+        """DELTA_DOD decode - reconstruct deltas, then restore timestamps"""
+        
+        result = self._decode_delta(vson_str, **options)
+        
+        ts_format = ts_data = None
+        for line in vson_str.split('\n'):
+            line = line.strip()
+            if line.startswith("ts_codec:"):
+                ts_format = line[len("ts_codec:"):].strip()
+            elif line.startswith("ts_data:"):
+                ts_data = line[len("ts_data:"):].strip()
+            elif line.startswith("base{"):
+                break
+        
+        # Written as plain delta_b (timestamps could not be packed)
+        if ts_format is None or ts_data is None:
+            return result
+        
+        try:
+            timestamps = codecs.unpack_timestamps(ts_format, base64.b64decode(ts_data))
+        except (ValueError, IndexError) as e:
+            raise VSONParseError(f"Invalid timestamp stream: {e}")
+        
+        snapshots = []
+        for timestamp, record in zip(timestamps, result["snapshots"]):
+            record.pop("timestamp", None)
+            snapshots.append({"timestamp": timestamp, **record})
+        
+        return {"snapshots": snapshots}
+    
+    def _decode_gorilla(self, vson_str: str, **options) -> Dict:
+        """GORILLA decode - merge compressed columns back into rows"""
+        
+        result = self.parser.parse(vson_str)
+        field_order = [f.strip() for f in result.pop("field_order", "").split(",") if f.strip()]
+        
+        columns = {}
+        for key in [k for k in result if k.startswith("gorilla.")]:
+            kind, _, payload = result.pop(key).partition(":")
+            try:
+                values = codecs.decode_floats_gorilla(base64.b64decode(payload))
+            except (ValueError, IndexError) as e:
+                raise VSONParseError(f"Invalid gorilla column {key}: {e}")
+            if kind == "i":
+                values = [int(v) for v in values]
+            columns[key[len("gorilla."):]] = values
+        
+        rows = result.get("snapshots")
+        if rows is None:
+            count = len(next(iter(columns.values()), []))
+            rows = [{}] * count
+        
+        result["snapshots"] = [
+            {f: columns[f][i] if f in columns else row.get(f) for f in field_order}
+            for i, row in enumerate(rows)
+        ]
+        return result
+    
+    def _decode_dict(self, vson_str: str, **options) -> Dict:
+        """DICT decode - replace codes with dictionary values"""
+        
+        result = self.parser.parse(vson_str)
+        
+        dictionaries = {}
+        for key in [k for k in result if k.startswith("dict.")]:
+            try:
+                dictionaries[key[len("dict."):]] = json.loads(result.pop(key))
+            except ValueError as e:
+                raise VSONParseError(f"Invalid dictionary {key}: {e}")
+        
+        for record in result.get("snapshots", []):
+            for field, dictionary in dictionaries.items():
+                if field in record:
+                    record[field] = dictionary[record[field]]
+        
+        return result
+    
     def _decode_with_depth(self, vson_str: str, **options) -> Dict:
         """DEPTH decode"""
-        return self.parser.parse(vson_str)
+        return self.parser.parse(vson_str, lazy=options.get("lazy", False))
     
     # =====================================================================
     # HELPER METHODS
@@ -369,7 +731,13 @@ class VSONSmart:
     
     def _detect_mode(self, vson_str: str) -> str:
         """Auto-detect encoding mode"""
-        if "# Mode: delta_b" in vson_str or "base{" in vson_str:
+        if "# Mode: gorilla" in vson_str:
+            return "gorilla"
+        elif "# Mode: dict" in vson_str:
+            return "dict"
+        elif "# Mode: delta_dod" in vson_str:
+            return "delta_dod"
+        elif "# Mode: delta_b" in vson_str or "base{" in vson_str:
             return "delta_b"
         elif "# Mode: depth_c" in vson_str or "buy_qty_5" in vson_str:
             return "depth_c"
@@ -399,6 +767,121 @@ class VSONSmart:
         filepath.write_text(vson_str, encoding='utf-8')
 
 
+class VSONStreamWriter:
+    """
+    Incrementally write a snapshots array to a VSON file.
+    
+    Rows are written as they arrive, so memory stays bounded by the caller's
+    batch size. The record count is unknown until close(); the header holds
+    a zero-padded placeholder that is patched in place. Rows of a lazily
+    decoded RawArray with the same fields are copied verbatim.
+    
+    Example:
+        with smart_encode_stream("merged.vson") as writer:
+            for path in paths:
+                writer.write_snapshots(smart_decode(path)["snapshots"])
+    """
+    
+    _COUNT_WIDTH = 12
+    
+    def __init__(
+        self,
+        filepath: Union[str, Path],
+        metadata: Optional[Dict[str, Any]] = None,
+        array_name: str = "snapshots"
+    ):
+        """
+        Open output file
+        
+        Args:
+            filepath: Output VSON file path
+            metadata: Header key/value pairs (written before the first row)
+            array_name: Name of the array section
+        """
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.metadata = dict(metadata or {})
+        self.array_name = array_name
+        self.fields: Optional[List[str]] = None
+        self.count = 0
+        self._serialize = VSONEncoder._serialize_value
+        self._count_offset = None
+        self._file = open(self.filepath, 'wb')
+    
+    def __enter__(self) -> "VSONStreamWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def write_snapshot(self, record: Dict[str, Any]) -> None:
+        """
+        Write one record
+        
+        Args:
+            record: Record dictionary; the first record fixes the field order
+        """
+        if self.fields is None:
+            self._write_header(list(record.keys()))
+        
+        serialize = self._serialize
+        row = ",".join([serialize(record.get(f, "")) for f in self.fields])
+        self._file.write(row.encode('utf-8') + b"\n")
+        self.count += 1
+    
+    def write_snapshots(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Write many records
+        
+        Args:
+            records: Iterable of records, or a RawArray from a lazy decode
+        """
+        if isinstance(records, RawArray):
+            if self.fields is None:
+                self._write_header(list(records.field_names))
+            
+            if records.field_names == self.fields:
+                # Same layout: copy encoded rows without parsing them
+                write = self._file.write
+                for line in records.raw_rows():
+                    write(line.encode('utf-8') + b"\n")
+                    self.count += 1
+                return
+        
+        for record in records:
+            self.write_snapshot(record)
+    
+    def close(self) -> None:
+        """Patch the record count and close the file"""
+        if self._file.closed:
+            return
+        
+        if self.fields is None:
+            self._write_metadata()
+        elif self._count_offset is not None:
+            self._file.seek(self._count_offset)
+            self._file.write(str(self.count).zfill(self._COUNT_WIDTH).encode('ascii'))
+        
+        self._file.close()
+    
+    def _write_metadata(self) -> None:
+        """Write header key/value pairs"""
+        lines = [f"{key}: {value}" for key, value in self.metadata.items()]
+        lines.append("")
+        self._file.write(("\n".join(lines) + "\n").encode('utf-8'))
+    
+    def _write_header(self, fields: List[str]) -> None:
+        """Write metadata and the array header with a count placeholder"""
+        self.fields = fields
+        self._write_metadata()
+        
+        self._file.write(f"{self.array_name}[".encode('utf-8'))
+        self._count_offset = self._file.tell()
+        self._file.write(
+            f"{'0' * self._COUNT_WIDTH}]{{{', '.join(fields)}}}:\n\n".encode('utf-8')
+        )
+
+
 # =========================================================================
 # MODULE-LEVEL FUNCTIONS
 # =========================================================================
@@ -421,3 +904,14 @@ def smart_decode(
 ) -> Union[Dict, List[Dict]]:
     """Decode with smart interface"""
     return _vson_smart.smart_decode(source, mode, **options)
+
+def smart_encode_stream(
+    filepath: Union[str, Path],
+    metadata: Optional[Dict[str, Any]] = None
+) -> VSONStreamWriter:
+    """Open a streaming writer (use as a context manager)"""
+    return VSONStreamWriter(filepath, metadata)
+
+def smart_peek(filepath: Union[str, Path]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Record count and first record of a VSON file"""
+    return _vson_smart.smart_peek(filepath)
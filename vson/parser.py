@@ -6,13 +6,69 @@ This module provides parsing functionality to convert VSON strings
 into Python dictionaries and objects.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Callable, Iterator
 import re
 
 from .exceptions import VSONParseError
 from .config import Config
 
 
+# Characters that can start a number, and a table that deletes every
+# character a float literal may contain (used to pre-check float syntax)
+_NUMERIC_START = frozenset('+-.0123456789')
+_FLOAT_CHARS_TABLE = str.maketrans('', '', '0123456789+-.eE')
+_NULL_VALUES = frozenset(('none', 'null', 'nil'))
+
+# Array definition line: name[count]{field1,field2,...}
+_ARRAY_HEADER_PATTERN = r'(\w+)\[(\d+)\]\{(.+?)\}'
+_ARRAY_HEADER_RE = re.compile(_ARRAY_HEADER_PATTERN)
+
+# The same header in raw bytes, at the search start or after a newline
+# (the literal '\n' prefix lets the regex engine skip ahead between lines)
+_ARRAY_HEADER_BYTES_RE = re.compile(rb'[ \t]*' + _ARRAY_HEADER_PATTERN.encode())
+_ARRAY_HEADER_LINE_RE = re.compile(rb'\n[ \t]*' + _ARRAY_HEADER_PATTERN.encode())
+
+
+def find_array_header(
+    buf,
+    start: int = 0,
+    end: Optional[int] = None
+) -> Optional[Tuple[int, str, int, List[str]]]:
+    """
+    Find the next array header line in raw VSON bytes
+    
+    Works on bytes and mmap objects without decoding the rows, so callers
+    can locate arrays in large files cheaply.
+    
+    Args:
+        buf: Raw VSON content
+        start: Offset to search from (should be at a line start)
+        end: Offset to stop at (default: end of buf)
+    
+    Returns:
+        Tuple of (line_offset, array_name, declared_count, field_names), or
+        None if there is no header in the range
+    """
+    if end is None:
+        end = len(buf)
+    
+    match = _ARRAY_HEADER_BYTES_RE.match(buf, start, end)
+    line_offset = start
+    if match is None:
+        match = _ARRAY_HEADER_LINE_RE.search(buf, start, end)
+        if match is None:
+            return None
+        line_offset = match.start() + 1
+    
+    fields = match.group(3).decode(Config.DEFAULT_ENCODING, errors='ignore')
+    return (
+        line_offset,
+        match.group(1).decode('ascii'),
+        int(match.group(2)),
+        [f.strip() for f in fields.split(',')],
+    )
+
+
 class VSONParser:
     """
     Parse VSON format strings into Python dictionaries.
@@ -42,14 +98,26 @@ class VSONParser:
         self.current_line = 0
         self.current_col = 0
         self._line_buffer = []
+        
+        # Specialized row parsers, keyed by array field names
+        self._field_types = self._schema_field_types(schema)
+        self._row_parsers: Dict[Tuple[str, ...], Optional[Callable]] = {}
     
-    def parse(self, vson_str: str, validate: bool = True) -> Dict[str, Any]:
+    def parse(
+        self,
+        vson_str: str,
+        validate: bool = True,
+        *,
+        lazy: bool = False
+    ) -> Dict[str, Any]:
         """
         Parse VSON string to dictionary
         
         Args:
             vson_str: VSON formatted string
             validate: Enable validation
+            lazy: Return arrays as unparsed RawArray objects; rows are only
+                parsed when iterated (len() just counts rows)
         
         Returns:
             Parsed data as dictionary
@@ -79,7 +147,7 @@ class VSONParser:
                 
                 # Check for array definition
                 if self._is_array_definition(line):
-                    array_name, array_data, next_i = self._parse_array(lines, i)
+                    array_name, array_data, next_i = self._parse_array(lines, i, lazy=lazy)
                     if array_name:
                         result[array_name] = array_data
                     i = next_i
@@ -142,7 +210,8 @@ class VSONParser:
     def _parse_array(
         self,
         lines: List[str],
-        start_idx: int
+        start_idx: int,
+        lazy: bool = False
     ) -> Tuple[Optional[str], List[Dict], int]:
         """
         Parse array section
@@ -150,6 +219,7 @@ class VSONParser:
         Args:
             lines: All lines
             start_idx: Starting line index
+            lazy: Only locate the array rows and return them as a RawArray
         
         Returns:
             Tuple of (array_name, array_data, next_index)
@@ -160,6 +230,7 @@ class VSONParser:
         try:
             # Parse array header: name[count]{fields}:
             array_name, field_names = self._parse_array_header(line)
+            row_parser = self._get_row_parser(field_names)
             array_data = []
             
             i = start_idx + 1
@@ -167,6 +238,10 @@ class VSONParser:
             # Skip blank lines after header
             i = self._skip_comments_and_blanks(lines, i)
             
+            if lazy:
+                end = self._find_array_end(lines, i)
+                return array_name, RawArray(lines, i, end, field_names, self), end
+            
             # Parse data rows
             while i < len(lines):
                 line = lines[i].strip()
@@ -182,11 +257,8 @@ class VSONParser:
                     break
                 
                 # Parse row
-                values = self._parse_row(line)
-                if values:
-                    row_dict = {}
-                    for field_name, value in zip(field_names, values):
-                        row_dict[field_name] = value
+                row_dict = self._row_to_dict(line, field_names, row_parser)
+                if row_dict is not None:
                     array_data.append(row_dict)
                 
                 i += 1
@@ -199,6 +271,105 @@ class VSONParser:
                 line=self.current_line
             )
     
+    def _find_array_end(self, lines: List[str], start_idx: int) -> int:
+        """
+        Find the index of the first line after an array's rows
+        
+        Args:
+            lines: All lines
+            start_idx: Index of the first row
+        
+        Returns:
+            Index of the next array definition, or len(lines)
+        """
+        is_array_definition = self._is_array_definition
+        i = start_idx
+        while i < len(lines):
+            if is_array_definition(lines[i].strip()):
+                break
+            i += 1
+        return i
+    
+    def _row_to_dict(
+        self,
+        line: str,
+        field_names: List[str],
+        row_parser: Optional[Callable] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Convert one data row to a record dictionary
+        
+        Uses the schema-specialized row parser when available and falls
+        back to generic type inference if the row does not match it.
+        
+        Args:
+            line: Stripped data row
+            field_names: Field names from the array header
+            row_parser: Specialized row parser (from _get_row_parser)
+        
+        Returns:
+            Record dictionary, or None for an empty row
+        """
+        if row_parser is not None:
+            try:
+                return row_parser(line)
+            except (ValueError, IndexError):
+                pass
+        
+        values = self._parse_row(line)
+        if not values:
+            return None
+        
+        row_dict = {}
+        for field_name, value in zip(field_names, values):
+            row_dict[field_name] = value
+        return row_dict
+    
+    def _parse_chunk(self, lines: List[str], field_names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse a block of data rows that share one array header
+        
+        The specialized row parser for the header is looked up once and
+        reused across calls, so streaming callers amortize it over every
+        chunk of the same array.
+        
+        Args:
+            lines: Stripped data rows (no blanks, comments or headers)
+            field_names: Field names from the array header
+        
+        Returns:
+            List of record dictionaries
+        """
+        row_parser = self._get_row_parser(field_names)
+        row_to_dict = self._row_to_dict
+        
+        records = []
+        for line in lines:
+            row_dict = row_to_dict(line, field_names, row_parser)
+            if row_dict is not None:
+                records.append(row_dict)
+        return records
+    
+    def reset_row_buffer(self) -> None:
+        """Clear the reusable line buffer used by streaming parsing"""
+        self._line_buffer.clear()
+    
+    def parse_bytes(self, buf: bytes, validate: bool = True) -> Dict[str, Any]:
+        """
+        Parse VSON from a bytes-like object (bytes, bytearray, memoryview, mmap)
+        
+        Args:
+            buf: UTF-8 encoded VSON data
+            validate: Enable validation
+        
+        Returns:
+            Parsed data as dictionary
+        """
+        return self.parse(
+            str(buf, Config.DEFAULT_ENCODING, Config.DEFAULT_ERRORS),
+            validate=validate
+        )
+    
     def _parse_array_header(self, line: str) -> Tuple[str, List[str]]:
         """
         Parse array definition line
@@ -214,10 +385,7 @@ class VSONParser:
         if not line.endswith(':'):
             line = line.rstrip(':')
         
-        match = re.match(
-            r'(\w+)\[\d+\]\{(.+?)\}',
-            line
-        )
+        match = _ARRAY_HEADER_RE.match(line)
         
         if not match:
             raise VSONParseError(
@@ -226,11 +394,96 @@ class VSONParser:
             )
         
         array_name = match.group(1)
-        fields_str = match.group(2)
+        fields_str = match.group(3)
         field_names = [f.strip() for f in fields_str.split(',')]
         
         return array_name, field_names
     
+    @staticmethod
+    def _schema_field_types(schema) -> Dict[str, str]:
+        """
+        Extract field name -> type name mapping from a schema
+        
+        Accepts a VSONSchema instance or a plain schema dictionary
+        ({'field': {'type': 'float', ...}}).
+        """
+        if schema is None:
+            return {}
+        
+        fields = getattr(schema, 'fields', None)
+        if isinstance(fields, dict):
+            return {name: f.field_type for name, f in fields.items()}
+        
+        if isinstance(schema, dict):
+            return {
+                name: field_def.get('type')
+                for name, field_def in schema.items()
+                if isinstance(field_def, dict)
+            }
+        
+        return {}
+    
+    def _get_row_parser(self, field_names: List[str]) -> Optional[Callable]:
+        """
+        Get (or build) the specialized row parser for an array header
+        
+        Args:
+            field_names: Field names from the array header
+        
+        Returns:
+            Compiled row parser, or None if the schema does not type any field
+        """
+        key = tuple(field_names)
+        if key not in self._row_parsers:
+            self._row_parsers[key] = self._compile_row_parser(field_names)
+        return self._row_parsers[key]
+    
+    def _compile_row_parser(self, field_names: List[str]) -> Optional[Callable]:
+        """
+        Generate a row parser with per-column coercion hard-coded from the schema
+        
+        The generated function splits the line once and converts each column
+        directly (float/int/str), skipping the _infer_type dispatch. Timestamp
+        columns and columns without a schema type still go through
+        _infer_type. Any ValueError or IndexError raised by the generated
+        code means the row does not match the schema, and the caller falls
+        back to the generic path.
+        
+        Args:
+            field_names: Field names from the array header
+        
+        Returns:
+            Row parser function, or None if no column is typed by the schema
+        """
+        if not any(self._field_types.get(name) for name in field_names):
+            return None
+        
+        items = []
+        for i, name in enumerate(field_names):
+            field_type = self._field_types.get(name)
+            if field_type in ('float', 'price'):
+                expr = f"float(p[{i}])"
+            elif field_type in ('int', 'volume'):
+                expr = f"int(p[{i}])"
+            elif field_type == 'str':
+                expr = f"(p[{i}].strip() or None)"
+            else:
+                # Untyped and timestamp columns (epoch ints or ISO strings)
+                expr = f"_infer(p[{i}].strip())"
+            items.append(f"{name!r}: {expr}")
+        
+        src = (
+            "def _parse_row_specialized(line):\n"
+            f"    p = line.split({Config.FIELD_DELIMITER!r})\n"
+            f"    if len(p) != {len(field_names)}:\n"
+            "        raise ValueError('column count mismatch')\n"
+            f"    return {{{', '.join(items)}}}\n"
+        )
+        
+        ns = {'_infer': self._infer_type}
+        exec(src, ns)
+        return ns['_parse_row_specialized']
+    
     def _parse_row(self, line: str) -> Optional[List[Any]]:
         """
         Parse data row with type inference
@@ -261,45 +514,62 @@ class VSONParser:
         """
         Infer and convert value type
         
+        Numbers are recognized from their characters before conversion, so
+        the common cases (ints, floats, plain strings) never raise and catch
+        a ValueError.
+        
         Args:
             value: String value
         
         Returns:
             Value with inferred type
         """
-        if not value or value == "":
+        if not value:
             return None
         
+        # Numeric
+        if value[0] in _NUMERIC_START:
+            digits = value[1:] if value[0] in '+-' else value
+            if digits.isdecimal():
+                return int(value)
+            if not value.translate(_FLOAT_CHARS_TABLE):
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+            return value
+        
+        lowered = value.lower()
+        
         # Boolean
-        if value.lower() == 'true':
+        if lowered == 'true':
             return True
-        if value.lower() == 'false':
+        if lowered == 'false':
             return False
         
         # None/null
-        if value.lower() in ('none', 'null', 'nil'):
+        if lowered in _NULL_VALUES:
             return None
         
-        # Numeric
-        try:
-            # Try integer first
-            if '.' not in value and 'e' not in value.lower():
-                return int(value)
-            # Then float
-            return float(value)
-        except ValueError:
-            pass
-        
         # String (default)
         return value
     
     def _is_array_definition(self, line: str) -> bool:
-        """Check if line is array definition"""
+        """
+        Check if line is array definition
+        
+        Array headers start with a short name followed by '[count]{', so the
+        '[' is searched only near the start of the line and the ']' only just
+        after it. Data rows (the common case) are rejected without scanning
+        the whole line, and rows containing JSON lists are not mistaken for
+        headers.
+        """
+        pos_lb = line.find('[', 0, 64)
         return (
-            '[' in line and
-            ']' in line and
-            '{' in line and
-            '}' in line
+            pos_lb > 0 and
+            (line[pos_lb - 1].isalnum() or line[pos_lb - 1] == '_') and
+            line.find(']', pos_lb, pos_lb + 16) != -1 and
+            line.find('{', pos_lb) != -1
         )
     
     @staticmethod
@@ -314,6 +584,79 @@ class VSONParser:
         return i
 
 
+class RawArray:
+    """
+    Unparsed array section returned by VSONParser.parse(..., lazy=True).
+    
+    Keeps a reference to the source lines and the row range instead of
+    building record dictionaries. Rows are parsed only when the array is
+    iterated; len() and raw_rows() never parse values, which is enough for
+    operations that only need record counts or copy rows verbatim.
+    
+    Example:
+        data = VSONParser().parse(vson_str, lazy=True)
+        count = len(data["snapshots"])
+        for record in data["snapshots"]:
+            process(record)
+    """
+    
+    def __init__(
+        self,
+        lines: List[str],
+        start: int,
+        end: int,
+        field_names: List[str],
+        parser: VSONParser
+    ):
+        """
+        Initialize raw array
+        
+        Args:
+            lines: All source lines
+            start: Index of the first row line
+            end: Index one past the last row line
+            field_names: Field names from the array header
+            parser: Parser used to parse rows on demand
+        """
+        self.lines = lines
+        self.start = start
+        self.end = end
+        self.field_names = field_names
+        self._parser = parser
+        self._length = None
+    
+    def raw_rows(self) -> Iterator[str]:
+        """Iterate over unparsed data rows (blank lines and comments skipped)"""
+        comment = Config.COMMENT_CHAR
+        for i in range(self.start, self.end):
+            line = self.lines[i].strip()
+            if line and not line.startswith(comment):
+                yield line
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Parse and yield records"""
+        parser = self._parser
+        field_names = self.field_names
+        row_parser = parser._get_row_parser(field_names)
+        for line in self.raw_rows():
+            row_dict = parser._row_to_dict(line, field_names, row_parser)
+            if row_dict is not None:
+                yield row_dict
+    
+    def __len__(self) -> int:
+        """Number of rows (counted once, without parsing)"""
+        if self._length is None:
+            self._length = sum(1 for _ in self.raw_rows())
+        return self._length
+    
+    def materialize(self) -> List[Dict[str, Any]]:
+        """Parse all rows into a list of records"""
+        return list(self)
+    
+    def __repr__(self) -> str:
+        return f"RawArray(rows={len(self)}, fields={self.field_names})"
+
+
 class StreamingVSONParser:
     """
     Parse VSON files in streaming mode for large datasets.
@@ -329,33 +672,59 @@ class StreamingVSONParser:
             process(chunk)
     """
     
-    def __init__(self, filepath: str, chunk_size: int = Config.CHUNK_SIZE):
+    def __init__(self, filepath: str, chunk_size: int = Config.CHUNK_SIZE, schema=None):
         """
         Initialize streaming parser
         
         Args:
             filepath: Path to VSON file
             chunk_size: Records per chunk
+            schema: Optional schema (enables specialized row parsing)
         """
         self.filepath = filepath
         self.chunk_size = chunk_size
-        self.parser = VSONParser()
+        self.parser = VSONParser(schema)
     
     def __iter__(self):
-        """Iterate over chunks"""
+        """
+        Iterate over chunks of parsed records
+        
+        Each chunk is a list of record dictionaries from a single array;
+        header metadata lines are skipped. The same VSONParser (and its
+        line buffer and compiled row parsers) is reused for every chunk.
+        """
+        parser = self.parser
+        buffer = parser._line_buffer
+        parser.reset_row_buffer()
+        field_names = None
+        
         with open(self.filepath, 'r', encoding=Config.DEFAULT_ENCODING) as f:
-            chunk = []
             for line in f:
                 line = line.strip()
-                if line and not line.startswith(Config.COMMENT_CHAR):
-                    chunk.append(line)
+                if not line or line.startswith(Config.COMMENT_CHAR):
+                    continue
+                
+                # New array: flush rows of the previous one
+                if parser._is_array_definition(line):
+                    if buffer:
+                        yield parser._parse_chunk(buffer, field_names)
+                        parser.reset_row_buffer()
+                    _, field_names = parser._parse_array_header(line)
+                    continue
+                
+                # Metadata before the first array
+                if field_names is None:
+                    continue
+                
+                buffer.append(line)
                 
-                if len(chunk) >= self.chunk_size:
-                    yield chunk
-                    chunk = []
+                if len(buffer) >= self.chunk_size:
+                    yield parser._parse_chunk(buffer, field_names)
+                    parser.reset_row_buffer()
             
-            if chunk:
-                yield chunk
+            if buffer:
+                yield parser._parse_chunk(buffer, field_names)
+                parser.reset_row_buffer()
     
     def parse_chunks(self) -> List[Dict[str, Any]]:
         """Parse all chunks and collect"""
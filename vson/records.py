@@ -0,0 +1,66 @@
+# vson/records.py
+"""
+VSON Record Types
+
+Slot-based record classes for the fixed market data shapes produced by
+MarketDataSerializer. They hold one attribute slot per field instead of a
+per-record dict, which keeps large record lists compact.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+class _SlotsRecord:
+    """Shared helpers for frozen slot records"""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert record to a field dictionary"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    # Frozen dataclasses reject setattr, so pickle needs explicit state
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+@dataclass(frozen=True)
+class OHLCRecord(_SlotsRecord):
+    """Open/high/low/close prices at a timestamp"""
+
+    __slots__ = ('timestamp', 'open', 'high', 'low', 'close')
+
+    timestamp: Any
+    open: float
+    high: float
+    low: float
+    close: float
+
+
+@dataclass(frozen=True)
+class VolumeRecord(_SlotsRecord):
+    """Traded volume and last price at a timestamp"""
+
+    __slots__ = ('timestamp', 'volume', 'last_price')
+
+    timestamp: Any
+    volume: int
+    last_price: float
+
+
+@dataclass(frozen=True)
+class DepthLevelRecord(_SlotsRecord):
+    """One bid/ask level of a market depth snapshot"""
+
+    __slots__ = ('level', 'bid_qty', 'bid_price', 'ask_qty', 'ask_price')
+
+    level: int
+    bid_qty: int
+    bid_price: float
+    ask_qty: int
+    ask_price: float
@@ -0,0 +1,85 @@
+# vson/serializers/_ts_kernels.py
+"""
+Time-Series Numeric Kernels
+
+Column kernels used by TimeSeriesSerializer. Compiled with Numba when it
+is installed, otherwise the same functions run as vectorized NumPy code.
+Requires NumPy either way; callers check HAS_KERNELS first. Results use
+the dtype of the input column (delta_decode casts base to it).
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+HAS_KERNELS = np is not None
+HAS_NUMBA = njit is not None
+
+
+if HAS_KERNELS and HAS_NUMBA:
+
+    @njit(cache=True)
+    def delta_encode(col):
+        """Differences between consecutive values (length n - 1)"""
+        n = col.shape[0]
+        out = np.empty(max(n - 1, 0), dtype=col.dtype)
+        for i in range(1, n):
+            out[i - 1] = col[i] - col[i - 1]
+        return out
+
+    @njit(cache=True)
+    def delta_decode(base, deltas):
+        """Running sum of deltas starting at base (length n + 1)"""
+        n = deltas.shape[0]
+        out = np.empty(n + 1, dtype=deltas.dtype)
+        out[0] = base
+        for i in range(n):
+            out[i + 1] = out[i] + deltas[i]
+        return out
+
+    @njit(cache=True)
+    def rle_encode(col):
+        """Run-length encode a column into (run values, run lengths)"""
+        n = col.shape[0]
+        starts = np.empty(n, dtype=np.int64)
+        runs = 0
+        for i in range(n):
+            if i == 0 or col[i] != col[i - 1]:
+                starts[runs] = i
+                runs += 1
+
+        values = np.empty(runs, dtype=col.dtype)
+        counts = np.empty(runs, dtype=np.int64)
+        for r in range(runs):
+            end = starts[r + 1] if r + 1 < runs else n
+            values[r] = col[starts[r]]
+            counts[r] = end - starts[r]
+        return values, counts
+
+elif HAS_KERNELS:
+
+    def delta_encode(col):
+        """Differences between consecutive values (length n - 1)"""
+        return col[1:] - col[:-1]
+
+    def delta_decode(base, deltas):
+        """Running sum of deltas starting at base (length n + 1)"""
+        # cumsum accumulates left to right, like the sequential loop
+        return np.cumsum(np.concatenate(([base], deltas)).astype(deltas.dtype))
+
+    def rle_encode(col):
+        """Run-length encode a column into (run values, run lengths)"""
+        n = col.shape[0]
+        if n == 0:
+            return col[:0], np.zeros(0, dtype=np.int64)
+
+        starts = np.concatenate(([0], np.flatnonzero(col[1:] != col[:-1]) + 1))
+        counts = np.diff(np.concatenate((starts, [n])))
+        return col[starts], counts
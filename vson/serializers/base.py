@@ -6,7 +6,9 @@ Abstract base class for all serializers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable, List, Tuple
+
+from ..validators.schema_validator import SchemaValidator
 
 
 class BaseSerializer(ABC):
@@ -25,6 +27,8 @@ class BaseSerializer(ABC):
             schema: Optional data schema
         """
         self.schema = schema
+        self._validator = None
+        self._validator_schema = None
     
     @abstractmethod
     def serialize(self, data: Dict[str, Any]) -> str:
@@ -83,10 +87,20 @@ class BaseSerializer(ABC):
         if not self.schema:
             return True, []
         
-        errors = []
-        
-        # Basic validation
         if not isinstance(data, dict):
-            errors.append("Data must be dictionary")
+            return False, ["Data must be dictionary"]
+        
+        return self._get_validator()(data)
+    
+    def _get_validator(self) -> Callable[[Dict[str, Any]], Tuple[bool, List[str]]]:
+        """
+        Return the compiled schema validator
         
-        return len(errors) == 0, errors
+        SchemaValidator.compile caches validators by schema contents, so
+        serializers sharing a schema share one validator. The instance keeps
+        a reference and recompiles only when self.schema is replaced.
+        """
+        if self._validator is None or self._validator_schema is not self.schema:
+            self._validator = SchemaValidator.compile(self.schema)
+            self._validator_schema = self.schema
+        return self._validator
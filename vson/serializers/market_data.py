@@ -5,8 +5,43 @@ Market Data Serializer
 Specialized serializer for trading market data (OHLC, depth, volume).
 """
 
-from typing import Dict, Any, List, Optional
-from .base import BaseSerializer  # ← ADD THIS LINE!
+from typing import Dict, Any, List, Optional, Union
+from .base import BaseSerializer
+from .. import codecs
+from ..records import OHLCRecord, VolumeRecord, DepthLevelRecord
+from ..validators.market_data import MarketDataValidator
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+# Depth level fields and their value types
+_DEPTH_FIELDS = (
+    ('level', int),
+    ('bid_qty', int),
+    ('bid_price', float),
+    ('ask_qty', int),
+    ('ask_price', float),
+)
+
+# Keys that trigger the OHLC and depth checks in validate()
+_OHLC_KEYS = frozenset(('open', 'high', 'low', 'close'))
+_BID_QTY_KEYS = tuple(f'bid_qty_{i}' for i in range(1, 6))
+
+
+def _float_column(values: List[Any]) -> Any:
+    """
+    Convert a column of numbers or numeric strings to float64
+    
+    NumPy parses the whole column in one C call; without NumPy (or when a
+    value is None, which NumPy would turn into NaN) float() is applied per
+    value.
+    """
+    if np is not None and None not in values:
+        return np.array(values, dtype=np.float64)
+    return [float(value) for value in values]
 
 
 class MarketDataSerializer(BaseSerializer):
@@ -24,6 +59,10 @@ class MarketDataSerializer(BaseSerializer):
         """Initialize market data serializer"""
         schema = self._get_market_data_schema()
         super().__init__(schema)
+        self.use_gorilla = False  # True: XOR-compress the price columns (mode="gorilla")
+        self.price_fields = [
+            name for name, spec in schema.items() if spec.get('type') == 'price'
+        ]
     
     def serialize(self, data: Dict[str, Any]) -> str:
         """
@@ -38,6 +77,8 @@ class MarketDataSerializer(BaseSerializer):
         # Import here to avoid circular dependency
         from ..core import smart_encode
         
+        if self.use_gorilla:
+            return smart_encode(data, mode="gorilla", gorilla_fields=self.price_fields)
         return smart_encode(data)
     
     def deserialize(self, data: str) -> Dict[str, Any]:
@@ -55,62 +96,184 @@ class MarketDataSerializer(BaseSerializer):
         
         return smart_decode(data)
     
-    def serialize_ohlc(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def serialize_ohlc(
+        self,
+        record: Dict[str, Any],
+        to_dict: bool = True
+    ) -> Union[Dict[str, Any], OHLCRecord]:
         """
         Serialize OHLC record
         
         Args:
             record: OHLC record
+            to_dict: Return a dict (False returns an OHLCRecord)
         
         Returns:
             Serialized record
         """
-        return {
-            'timestamp': record.get('timestamp'),
-            'open': float(record.get('open', 0)),
-            'high': float(record.get('high', 0)),
-            'low': float(record.get('low', 0)),
-            'close': float(record.get('close', 0)),
-        }
+        values = (
+            record.get('timestamp'),
+            float(record.get('open', 0)),
+            float(record.get('high', 0)),
+            float(record.get('low', 0)),
+            float(record.get('close', 0)),
+        )
+        if not to_dict:
+            return OHLCRecord(*values)
+        return dict(zip(OHLCRecord.__slots__, values))
     
-    def serialize_depth(self, depth_data: List[Dict]) -> List[Dict]:
+    def serialize_ohlc_columns(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Serialize many OHLC records as columns
+        
+        Batch form of serialize_ohlc: each price column is parsed in one
+        call, which matters when prices arrive as strings (CSV input).
+        
+        Args:
+            records: OHLC records
+        
+        Returns:
+            Column name -> values (float64 ndarrays for prices)
+        """
+        columns = {'timestamp': [record.get('timestamp') for record in records]}
+        for field in ('open', 'high', 'low', 'close'):
+            columns[field] = _float_column([record.get(field, 0) for record in records])
+        return columns
+    
+    def serialize_depth(
+        self,
+        depth_data: List[Dict],
+        to_dict: bool = True
+    ) -> Union[List[Dict], List[DepthLevelRecord]]:
         """
         Serialize market depth data
         
         Args:
             depth_data: Depth level data
+            to_dict: Return dicts (False returns DepthLevelRecords)
         
         Returns:
             Serialized depth data
         """
-        serialized = []
+        columns = self.serialize_depth_columns(depth_data)
+        values = [
+            column.tolist() if np is not None and not isinstance(column, list) else column
+            for column in columns.values()
+        ]
+        if not to_dict:
+            return [DepthLevelRecord(*row) for row in zip(*values)]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    
+    def serialize_depth_columns(self, depth_data: List[Dict]) -> Dict[str, Any]:
+        """
+        Serialize market depth as columns (structure of arrays)
+        
+        Args:
+            depth_data: Depth level data
+        
+        Returns:
+            Column name -> int64/float64 ndarray (plain lists without numpy)
+        """
+        n = len(depth_data)
+        columns = {}
         
-        for level in depth_data:
-            serialized_level = {
-                'level': int(level.get('level', 0)),
-                'bid_qty': int(level.get('bid_qty', 0)),
-                'bid_price': float(level.get('bid_price', 0)),
-                'ask_qty': int(level.get('ask_qty', 0)),
-                'ask_price': float(level.get('ask_price', 0)),
-            }
-            serialized.append(serialized_level)
+        for field, cast in _DEPTH_FIELDS:
+            if np is not None:
+                dtype = np.int64 if cast is int else np.float64
+                try:
+                    columns[field] = np.fromiter(
+                        (level.get(field, 0) for level in depth_data), dtype=dtype, count=n
+                    )
+                    continue
+                except OverflowError:
+                    pass
+            columns[field] = [cast(level.get(field, 0)) for level in depth_data]
         
-        return serialized
+        return columns
     
-    def serialize_volume(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def serialize_depth_dict(
+        self,
+        depth_data: List[Dict],
+        max_size: int = 256
+    ) -> Dict[str, Any]:
+        """
+        Serialize market depth with per-column dictionary encoding
+        
+        Args:
+            depth_data: Depth level data
+            max_size: Largest dictionary per column (256 fits a byte)
+        
+        Returns:
+            Column name -> {'dict': values, 'idx': codes}, or the raw value
+            list for columns with more than max_size distinct values
+        """
+        columns = {}
+        for field, column in self.serialize_depth_columns(depth_data).items():
+            values = column if isinstance(column, list) else column.tolist()
+            encoded = codecs.dictionary_encode(values, max_size)
+            if encoded is None:
+                columns[field] = values
+            else:
+                columns[field] = {'dict': encoded[0], 'idx': encoded[1]}
+        
+        return columns
+    
+    @staticmethod
+    def deserialize_depth_dict(columns: Dict[str, Any]) -> List[Dict]:
+        """
+        Rebuild depth levels from serialize_depth_dict output
+        
+        Args:
+            columns: Dictionary-encoded depth columns
+        
+        Returns:
+            List of depth level records
+        """
+        decoded = {
+            field: codecs.dictionary_decode(column['dict'], column['idx'])
+            if isinstance(column, dict) else column
+            for field, column in columns.items()
+        }
+        return [dict(zip(decoded, row)) for row in zip(*decoded.values())]
+    
+    def serialize_volume(
+        self,
+        record: Dict[str, Any],
+        to_dict: bool = True
+    ) -> Union[Dict[str, Any], VolumeRecord]:
         """
         Serialize volume data
         
         Args:
             record: Record with volume data
+            to_dict: Return a dict (False returns a VolumeRecord)
         
         Returns:
             Serialized volume record
         """
+        values = (
+            record.get('timestamp'),
+            int(record.get('volume', 0)),
+            float(record.get('last_price', 0)),
+        )
+        if not to_dict:
+            return VolumeRecord(*values)
+        return dict(zip(VolumeRecord.__slots__, values))
+    
+    def serialize_volume_columns(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Serialize many volume records as columns
+        
+        Args:
+            records: Records with volume data
+        
+        Returns:
+            Column name -> values (float64 ndarray for last_price)
+        """
         return {
-            'timestamp': record.get('timestamp'),
-            'volume': int(record.get('volume', 0)),
-            'last_price': float(record.get('last_price', 0)),
+            'timestamp': [record.get('timestamp') for record in records],
+            'volume': [int(record.get('volume', 0)) for record in records],
+            'last_price': _float_column([record.get('last_price', 0) for record in records]),
         }
     
     def validate(self, data: Dict[str, Any]) -> tuple:
@@ -123,25 +286,23 @@ class MarketDataSerializer(BaseSerializer):
         Returns:
             Tuple of (is_valid, errors)
         """
-        errors = []
+        is_valid, errors = super().validate(data)
+        if not isinstance(data, dict):
+            return is_valid, errors
         
-        # Import validator here to avoid circular dependency
-        from ..validators.market_data import MarketDataValidator
+        keys = data.keys()
         
         # Check OHLC
-        if all(k in data for k in ['open', 'high', 'low', 'close']):
-            is_valid, ohlc_errors = MarketDataValidator.validate_ohlc(data)
-            errors.extend(ohlc_errors)
+        if keys >= _OHLC_KEYS:
+            errors.extend(MarketDataValidator.validate_ohlc(data)[1])
         
         # Check depth
-        if any(f'bid_qty_{i}' in data for i in range(1, 6)):
-            is_valid, depth_errors = MarketDataValidator.validate_depth(data)
-            errors.extend(depth_errors)
-        
-        # Check volume
-        if 'volume' in data:
-            is_valid, vol_errors = MarketDataValidator.validate_volume(data)
-            errors.extend(vol_errors)
+        if not keys.isdisjoint(_BID_QTY_KEYS):
+            errors.extend(MarketDataValidator.validate_depth(data)[1])
+        
+        # Check volume (unless the schema's volume type already did)
+        if 'volume' in data and 'volume' not in (self.schema or ()):
+            errors.extend(MarketDataValidator.validate_volume(data)[1])
         
         return len(errors) == 0, errors
     
@@ -7,6 +7,65 @@ Specialized serializer for time-series data with delta compression support.
 
 from typing import Dict, Any, List, Optional  # ← ADD THIS LINE!
 from .base import BaseSerializer  # ← MUST IMPORT!
+from . import _ts_kernels
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+def _records_to_columns(records: List[Dict]) -> Optional[Dict[str, Any]]:
+    """
+    Convert records (array of dicts) to columns (dict of arrays)
+    
+    Numeric fields become one int64 or float64 ndarray each; other fields
+    stay plain lists. The key set of the first record is used for all.
+    
+    Args:
+        records: Records sharing the same keys
+    
+    Returns:
+        Dictionary of columns, or None if the records cannot be converted
+        losslessly (numpy missing, differing keys, bools, fields mixing
+        numbers and other values, or ints outside the int64 range)
+    """
+    if np is None or not records:
+        return None
+    
+    first_keys = records[0].keys()
+    for record in records:
+        if record.keys() != first_keys:
+            return None
+    
+    n = len(records)
+    columns = {}
+    
+    for key in first_keys:
+        values = [record[key] for record in records]
+        
+        numeric = 0
+        all_int = True
+        for value in values:
+            if isinstance(value, bool):
+                return None
+            if isinstance(value, (int, float)):
+                numeric += 1
+                if not isinstance(value, int):
+                    all_int = False
+        
+        if numeric == 0:
+            columns[key] = values
+        elif numeric == n:
+            dtype = np.int64 if all_int else np.float64
+            try:
+                columns[key] = np.fromiter(values, dtype=dtype, count=n)
+            except OverflowError:
+                return None
+        else:
+            return None
+    
+    return columns
 
 
 class TimeSeriesSerializer(BaseSerializer):
@@ -25,6 +84,7 @@ class TimeSeriesSerializer(BaseSerializer):
         schema = self._get_timeseries_schema()
         super().__init__(schema)
         self.use_delta = True
+        self.delta_mode = "delta_b"  # or "delta_dod" (packed timestamps), "gorilla" (float columns)
         self.base_record = None
     
     def serialize(self, data: Dict[str, Any]) -> str:
@@ -41,7 +101,7 @@ class TimeSeriesSerializer(BaseSerializer):
         from ..core import smart_encode
         
         if self.use_delta:
-            return smart_encode(data, mode="delta_b")
+            return smart_encode(data, mode=self.delta_mode)
         else:
             return smart_encode(data, mode="default")
     
@@ -58,7 +118,7 @@ class TimeSeriesSerializer(BaseSerializer):
         # Import here to avoid circular dependency
         from ..core import smart_decode
         
-        return smart_decode(data, mode="delta_b")
+        return smart_decode(data, mode=self.delta_mode)
     
     def apply_delta_compression(self, records: List[Dict]) -> Dict[str, Any]:
         """
@@ -74,11 +134,15 @@ class TimeSeriesSerializer(BaseSerializer):
             return {'base': {}, 'deltas': []}
         
         base = records[0]
-        deltas = []
+        columns = _records_to_columns(records)
         
-        for i in range(1, len(records)):
-            delta = self._calculate_delta(records[i], records[i-1])
-            deltas.append(delta)
+        if columns is not None:
+            deltas = self._deltas_from_columns(records, columns)
+        else:
+            deltas = []
+            for i in range(1, len(records)):
+                delta = self._calculate_delta(records[i], records[i-1])
+                deltas.append(delta)
         
         return {
             'base': base,
@@ -101,6 +165,11 @@ class TimeSeriesSerializer(BaseSerializer):
         Returns:
             Reconstructed time-series records
         """
+        columns = self._reconstruct_columns(base, deltas)
+        if columns is not None:
+            rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+            return [base.copy()] + rows
+        
         records = [base.copy()]
         current = base.copy()
         
@@ -122,6 +191,50 @@ class TimeSeriesSerializer(BaseSerializer):
         
         return records
     
+    @staticmethod
+    def _reconstruct_columns(base: Dict, deltas: List[Dict]) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild every non-base record column-wise
+        
+        Each delta_<key> column becomes one running sum (delta_decode) from
+        the base value; timestamps and untouched keys are plain columns.
+        Same results as the record loop in reconstruct_from_deltas.
+        
+        Returns:
+            Key -> values for records 1..n, or None if the deltas do not
+            share one key set (the record loop handles those)
+        """
+        if not _ts_kernels.HAS_KERNELS or not deltas:
+            return None
+        
+        delta_keys = deltas[0].keys()
+        for delta in deltas:
+            if delta.keys() != delta_keys:
+                return None
+        
+        n = len(deltas)
+        targets = {}
+        for key in delta_keys:
+            if key.startswith('delta_'):
+                original_key = key.replace('delta_', '')
+                if original_key == 'timestamp' or original_key in targets:
+                    return None
+                if original_key in base:
+                    targets[original_key] = key
+        
+        columns = {key: [value] * n for key, value in base.items()}
+        
+        if 'timestamp' in delta_keys:
+            columns['timestamp'] = [delta['timestamp'] for delta in deltas]
+        
+        for original_key, key in targets.items():
+            steps = np.fromiter(
+                (float(delta[key] or 0) for delta in deltas), dtype=np.float64, count=n
+            )
+            columns[original_key] = _ts_kernels.delta_decode(float(base[original_key]), steps)[1:].tolist()
+        
+        return columns
+    
     def compress_repeated_values(self, records: List[Dict], field: str) -> List[Dict]:
         """
         Compress repeated values in field
@@ -136,6 +249,18 @@ class TimeSeriesSerializer(BaseSerializer):
         if not records:
             return []
         
+        count_key = f'{field}_repeat_count'
+        run_lengths = self._run_lengths([record.get(field) for record in records])
+        
+        # Vectorized path: touch records only at run boundaries
+        if run_lengths is not None:
+            compressed = []
+            end = -1
+            for count in run_lengths:
+                end += count
+                compressed.append({**records[end], count_key: count})
+            return compressed
+        
         compressed = []
         current_value = records[0].get(field)
         count = 1
@@ -148,7 +273,7 @@ class TimeSeriesSerializer(BaseSerializer):
             else:
                 compressed.append({
                     **records[i-1],
-                    f'{field}_repeat_count': count,
+                    count_key: count,
                 })
                 current_value = value
                 count = 1
@@ -157,11 +282,65 @@ class TimeSeriesSerializer(BaseSerializer):
         if records:
             compressed.append({
                 **records[-1],
-                f'{field}_repeat_count': count,
+                count_key: count,
             })
         
         return compressed
     
+    @staticmethod
+    def _run_lengths(values: List[Any]) -> Optional[List[int]]:
+        """
+        Lengths of runs of equal consecutive values
+        
+        Ints and floats use typed arrays; strings and None use an object
+        array compared element-wise. Returns None for other values or
+        without numpy.
+        """
+        if not _ts_kernels.HAS_KERNELS:
+            return None
+        
+        n = len(values)
+        kinds = {type(value) for value in values}
+        
+        if kinds == {int} or kinds == {float}:
+            dtype = np.int64 if kinds == {int} else np.float64
+            try:
+                column = np.fromiter(values, dtype=dtype, count=n)
+            except OverflowError:
+                return None
+            return _ts_kernels.rle_encode(column)[1].tolist()
+        
+        if kinds <= {str, type(None)}:
+            column = np.empty(n, dtype=object)
+            column[:] = values
+            changes = np.flatnonzero(column[1:] != column[:-1]) + 1
+            return np.diff(np.concatenate(([0], changes, [n]))).tolist()
+        
+        return None
+    
+    @staticmethod
+    def _deltas_from_columns(records: List[Dict], columns: Dict[str, Any]) -> List[Dict]:
+        """
+        Calculate all deltas with one vector subtraction per numeric column
+        
+        Produces the same records as calling _calculate_delta on each
+        consecutive pair.
+        """
+        delta_keys = ['timestamp']
+        delta_columns = [[record.get('timestamp') for record in records[1:]]]
+        
+        for key, column in columns.items():
+            if key == 'timestamp':
+                continue
+            
+            delta_keys.append(f'delta_{key}')
+            if isinstance(column, list):
+                delta_columns.append(column[1:])
+            else:
+                delta_columns.append(_ts_kernels.delta_encode(column).tolist())
+        
+        return [dict(zip(delta_keys, row)) for row in zip(*delta_columns)]
+    
     @staticmethod
     def _calculate_delta(current: Dict, previous: Dict) -> Dict:
         """Calculate delta between records"""
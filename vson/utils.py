@@ -5,15 +5,42 @@ VSON Utility Functions
 Helper functions for file operations, formatting, validation, and analysis.
 """
 
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
+import hashlib
+import importlib.util
+import json
+import math
+import mmap
 import os
+import re
+
+from .core import _PACKED_MODE_RE
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional
+    xxhash = None
+
+
+# Array header at the start of a line: name[count]{fields}
+_ARRAY_HEADER_BYTES_RE = re.compile(rb'(\w+)\[(\d+)\](\{.*)')
 
 
 # =========================================================================
 # FILE SIZE UTILITIES
 # =========================================================================
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_size(bytes_size: int) -> str:
     """
     Format bytes to human-readable size
@@ -28,11 +55,12 @@ def format_size(bytes_size: int) -> str:
         >>> format_size(2621440)
         '2.50 MB'
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024:
-            return f"{bytes_size:.2f} {unit}"
-        bytes_size /= 1024
-    return f"{bytes_size:.2f} PB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.2f} B"
+    
+    # Each unit is 10 bits wider than the previous one
+    idx = min((int(bytes_size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (idx * 10)):.2f} {_SIZE_UNITS[idx]}"
 
 
 def estimate_compression(json_size: int) -> int:
@@ -91,30 +119,34 @@ def merge_files(
     if not file_paths:
         raise ValueError("No files to merge")
     
-    import json as _json
-    
-    merged_data = {"snapshots": []}
+    # Import here to avoid circular dependency
+    from .core import smart_decode, smart_encode_stream, _vson_smart
     
-    for i, file_path in enumerate(file_paths):
+    for file_path in file_paths:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
-        
-        # Import here to avoid circular dependency
-        from .core import smart_decode
-        
-        if verbose:
-            print(f"Reading {i + 1}/{len(file_paths)}: {file_path}")
-        
-        data = smart_decode(file_path)
-        
-        if isinstance(data, dict):
-            if "snapshots" in data:
-                merged_data["snapshots"].extend(data["snapshots"])
-    
-    # Import here to avoid circular dependency
-    from .core import smart_encode
     
-    smart_encode(merged_data, output_path)
+    writer = None
+    try:
+        for i, file_path in enumerate(file_paths):
+            if verbose:
+                print(f"Reading {i + 1}/{len(file_paths)}: {file_path}")
+            
+            # Lazy decode: rows stay unparsed and are copied as-is
+            data = smart_decode(file_path, lazy=True)
+            
+            if writer is None:
+                metadata = _vson_smart._extract_metadata(data) if isinstance(data, dict) else {}
+                writer = smart_encode_stream(output_path, metadata)
+            
+            if isinstance(data, dict) and "snapshots" in data:
+                writer.write_snapshots(data["snapshots"])
+            
+            # Only one input file is held in memory at a time
+            del data
+    finally:
+        if writer is not None:
+            writer.close()
     
     if verbose:
         print(f"âœ… Merged {len(file_paths)} files â†’ {output_path}")
@@ -151,24 +183,149 @@ def split_file(
     if verbose:
         print(f"Reading {input_path}...")
     
+    # Plain snapshot files are split by copying row byte ranges
+    created_files = _fast_split(input_path, output_dir, chunk_size, verbose)
+    if created_files is not None:
+        return created_files
+    
     data = smart_decode(input_path)
     snapshots = data.get("snapshots", [])
     
-    created_files = []
     num_chunks = (len(snapshots) + chunk_size - 1) // chunk_size
     
-    for i in range(num_chunks):
+    def write_chunk(i: int) -> Tuple[Path, int]:
         start_idx = i * chunk_size
         end_idx = start_idx + chunk_size
         chunk_snapshots = snapshots[start_idx:end_idx]
         
         # Create chunk file
         chunk_file = output_dir / f"chunk_{i:04d}.vson"
-        smart_encode({"snapshots": chunk_snapshots}, chunk_file)
-        created_files.append(chunk_file)
+        smart_encode(chunk_snapshots, chunk_file)
+        return chunk_file, len(chunk_snapshots)
+    
+    return _write_chunks(write_chunk, num_chunks, verbose)
+
+
+def _write_chunks(write_chunk, num_chunks: int, verbose: bool = False) -> List[Path]:
+    """
+    Write independent chunk files on a thread pool
+    
+    File writes release the GIL, so chunks overlap their I/O.
+    
+    Args:
+        write_chunk: Function taking a chunk index and returning
+            (chunk_file, record_count)
+        num_chunks: Number of chunks
+        verbose: Print progress (in chunk order)
+    
+    Returns:
+        List of created file paths
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    created_files = []
+    workers = max(min(os.cpu_count() or 1, 8, num_chunks), 1)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for i, (chunk_file, count) in enumerate(pool.map(write_chunk, range(num_chunks))):
+            created_files.append(chunk_file)
+            
+            if verbose:
+                print(f"  Chunk {i + 1}/{num_chunks}: {count} records -> {chunk_file}")
+    
+    return created_files
+
+
+def _fast_split(
+    input_path: Path,
+    output_dir: Path,
+    chunk_size: int,
+    verbose: bool = False
+) -> Optional[List[Path]]:
+    """
+    Split a VSON file without parsing or re-encoding its rows
+    
+    The file is memory-mapped and scanned once for row start offsets of
+    its `snapshots` array. Each chunk is written as the original metadata
+    header, a rewritten `snapshots[count]{fields}:` line and the raw bytes
+    of its rows.
+    
+    Args:
+        input_path: Input file path
+        output_dir: Output directory for chunks
+        chunk_size: Records per chunk
+        verbose: Print progress
+    
+    Returns:
+        List of created file paths, or None if the file layout is not a
+        plain snapshots array (the caller then falls back to decoding)
+    """
+    with open(input_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+    
+    with mm:
+        size = len(mm)
+        header_start = header_match = None
+        row_offsets = []
+        data_end = size
+        
+        pos = 0
+        while pos < size:
+            nl = mm.find(b'\n', pos)
+            if nl == -1:
+                nl = size
+            line = mm[pos:nl].strip()
+            
+            if line and not line.startswith(b'#'):
+                match = _ARRAY_HEADER_BYTES_RE.match(line)
+                if header_match is None:
+                    if match:
+                        # First array must be the snapshots array
+                        if match.group(1) != b'snapshots':
+                            return None
+                        header_start, header_match = pos, match
+                elif match:
+                    data_end = pos
+                    break
+                else:
+                    row_offsets.append(pos)
+            
+            pos = nl + 1
+        
+        if header_match is None or not row_offsets:
+            return None
+        
+        # Delta/gorilla/dict rows depend on the header or earlier rows
+        if _PACKED_MODE_RE.search(mm, 0, header_start):
+            return None
         
-        if verbose:
-            print(f"  Chunk {i + 1}/{num_chunks}: {len(chunk_snapshots)} records â†’ {chunk_file}")
+        metadata = mm[:header_start]
+        fields = header_match.group(3)
+        num_rows = len(row_offsets)
+        num_chunks = (num_rows + chunk_size - 1) // chunk_size
+        
+        view = memoryview(mm)
+        
+        def write_chunk(i: int) -> Tuple[Path, int]:
+            first = i * chunk_size
+            last = min(first + chunk_size, num_rows)
+            start = row_offsets[first]
+            end = row_offsets[last] if last < num_rows else data_end
+            
+            chunk_file = output_dir / f"chunk_{i:04d}.vson"
+            with open(chunk_file, 'wb') as out:
+                out.write(metadata)
+                out.write(b'snapshots[%d]%s\n\n' % (last - first, fields))
+                out.write(view[start:end])
+            return chunk_file, last - first
+        
+        try:
+            created_files = _write_chunks(write_chunk, num_chunks, verbose)
+        finally:
+            view.release()
     
     return created_files
 
@@ -210,7 +367,8 @@ def validate_file(filepath: Path) -> Tuple[bool, List[str]]:
 def diff_files(
     file1: Path,
     file2: Path,
-    verbose: bool = False
+    verbose: bool = False,
+    mode: str = "count"
 ) -> Dict[str, Any]:
     """
     Compare two VSON files
@@ -219,6 +377,9 @@ def diff_files(
         file1: First file path
         file2: Second file path
         verbose: Print details
+        mode: "count" compares record counts from the file headers;
+            "content" also compares records by hash, so added/removed
+            count records present in only one file
     
     Returns:
         Difference report
@@ -227,38 +388,82 @@ def diff_files(
         diff = diff_files(Path("old.vson"), Path("new.vson"))
         print(f"Records added: {diff['added']}")
     """
-    from .core import smart_decode
+    from .core import smart_peek
+    
+    if mode not in ("count", "content"):
+        raise ValueError(f"Unknown diff mode: {mode}")
     
     if not file1.exists():
         raise FileNotFoundError(f"File not found: {file1}")
     if not file2.exists():
         raise FileNotFoundError(f"File not found: {file2}")
     
-    data1 = smart_decode(file1)
-    data2 = smart_decode(file2)
-    
-    snapshots1 = data1.get("snapshots", [])
-    snapshots2 = data2.get("snapshots", [])
-    
-    added = len(snapshots2) - len(snapshots1)
+    if mode == "count":
+        count1 = smart_peek(file1)[0]
+        count2 = smart_peek(file2)[0]
+        added = max(count2 - count1, 0)
+        removed = max(count1 - count2, 0)
+    else:
+        # Multiset of record hashes; rows are parsed one at a time
+        hashes1, count1 = _record_hashes(file1)
+        hashes2, count2 = _record_hashes(file2)
+        added = sum((hashes2 - hashes1).values())
+        removed = sum((hashes1 - hashes2).values())
     
     diff_report = {
         "file1": str(file1),
         "file2": str(file2),
-        "records_file1": len(snapshots1),
-        "records_file2": len(snapshots2),
-        "records_added": max(added, 0),
-        "records_removed": max(-added, 0),
+        "records_file1": count1,
+        "records_file2": count2,
+        "records_added": added,
+        "records_removed": removed,
     }
     
     if verbose:
-        print(f"File 1: {len(snapshots1)} records")
-        print(f"File 2: {len(snapshots2)} records")
-        print(f"Difference: {added:+d} records")
+        print(f"File 1: {count1} records")
+        print(f"File 2: {count2} records")
+        print(f"Difference: {count2 - count1:+d} records")
+        if mode == "content":
+            print(f"Only in file 2: {added}, only in file 1: {removed}")
     
     return diff_report
 
 
+def _record_hashes(filepath: Path) -> Tuple[Counter, int]:
+    """
+    Hash every record of a file
+    
+    Records are hashed as canonical JSON (sorted keys, integral floats as
+    ints) with xxh3 when xxhash is installed, blake2b otherwise.
+    
+    Returns:
+        Tuple of (Counter of record digests, record count)
+    """
+    from .core import smart_decode
+    
+    data = smart_decode(filepath, lazy=True)
+    snapshots = data.get("snapshots", []) if isinstance(data, dict) else []
+    
+    hashes = Counter()
+    for record in snapshots:
+        # 2.0 and 2 are equal records (text modes write floats like 2.0 as 2)
+        record = {
+            k: int(v) if type(v) is float and v.is_integer() else v
+            for k, v in record.items()
+        }
+        payload = json.dumps(record, sort_keys=True, separators=(',', ':'), default=str)
+        hashes[_digest(payload.encode('utf-8'))] += 1
+    
+    return hashes, sum(hashes.values())
+
+
+def _digest(payload: bytes) -> bytes:
+    """64-bit digest of a byte string"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(payload)
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
 # =========================================================================
 # FILE STATISTICS
 # =========================================================================
@@ -278,26 +483,26 @@ def get_file_stats(filepath: Path) -> Dict[str, Any]:
         print(f"Records: {stats['num_records']}")
         print(f"Size: {stats['file_size_formatted']}")
     """
-    from .core import smart_decode
+    from .core import smart_peek
     
-    if not filepath.exists():
+    try:
+        file_size = os.stat(filepath).st_size
+    except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    file_size = filepath.stat().st_size
-    data = smart_decode(filepath)
-    snapshots = data.get("snapshots", [])
+    # Header count and first row only; the file is not decoded
+    num_records, first_record = smart_peek(filepath)
     
     # Calculate field stats
     fields = {}
-    if snapshots:
-        first_record = snapshots[0]
+    if first_record:
         fields = {k: type(v).__name__ for k, v in first_record.items()}
     
     stats = {
         "file_path": str(filepath),
         "file_size": file_size,
         "file_size_formatted": format_size(file_size),
-        "num_records": len(snapshots),
+        "num_records": num_records,
         "num_fields": len(fields),
         "fields": fields,
     }
@@ -305,6 +510,16 @@ def get_file_stats(filepath: Path) -> Dict[str, Any]:
     return stats
 
 
+def _json_bytes(data: Any) -> bytes:
+    """Compact UTF-8 JSON (orjson when installed)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:  # e.g. non-str keys or ints beyond 64 bits
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def compare_formats(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Compare VSON vs JSON for given data
@@ -321,16 +536,14 @@ def compare_formats(data: Dict[str, Any]) -> Dict[str, Any]:
         print(f"JSON: {comparison['json_size']}")
         print(f"Compression: {comparison['compression_ratio']:.1f}x")
     """
-    import json as _json
     from .core import smart_encode
     
-    # VSON encoding
+    # VSON encoding (ASCII output needs no separate UTF-8 pass)
     vson_str = smart_encode(data)
-    vson_size = len(vson_str.encode('utf-8'))
+    vson_size = len(vson_str) if vson_str.isascii() else len(vson_str.encode('utf-8'))
     
-    # JSON encoding
-    json_str = _json.dumps(data)
-    json_size = len(json_str.encode('utf-8'))
+    # JSON encoding (compact, as produced by orjson)
+    json_size = len(_json_bytes(data))
     
     # Calculate ratio
     ratio = json_size / vson_size if vson_size > 0 else 0
@@ -363,37 +576,23 @@ def check_dependencies() -> Dict[str, bool]:
         if deps['brotli']:
             print("brotli compression available")
     """
-    dependencies = {}
-    
-    # Check gzip (builtin)
-    try:
-        import gzip
-        dependencies['gzip'] = True
-    except ImportError:
-        dependencies['gzip'] = False
-    
-    # Check brotli (optional)
-    try:
-        import brotli
-        dependencies['brotli'] = True
-    except ImportError:
-        dependencies['brotli'] = False
-    
-    # Check pandas (optional)
-    try:
-        import pandas
-        dependencies['pandas'] = True
-    except ImportError:
-        dependencies['pandas'] = False
-    
-    # Check numpy (optional)
-    try:
-        import numpy
-        dependencies['numpy'] = True
-    except ImportError:
-        dependencies['numpy'] = False
-    
-    return dependencies
+    return dict(_probe_dependencies())
+
+
+_OPTIONAL_MODULES = ('gzip', 'brotli', 'pandas', 'numpy')
+
+
+@lru_cache(maxsize=1)
+def _probe_dependencies() -> Tuple[Tuple[str, bool], ...]:
+    """Locate optional modules once per process without importing them"""
+    status = []
+    for name in _OPTIONAL_MODULES:
+        try:
+            found = importlib.util.find_spec(name) is not None
+        except (ImportError, ValueError):
+            found = False
+        status.append((name, found))
+    return tuple(status)
 
 
 def get_library_info() -> Dict[str, str]:
@@ -403,77 +602,121 @@ def get_library_info() -> Dict[str, str]:
     Returns:
         Dictionary with library info
     """
+    return dict(_library_info())
+
+
+@lru_cache(maxsize=1)
+def _library_info() -> Tuple[Tuple[str, str], ...]:
+    """Library info pairs (built once)"""
     from . import __version__
     
-    return {
-        "library": "VSON",
-        "version": __version__,
-        "description": "Vesion Snapshot Object Notation",
-        "format": "Text-based, CSV-like structure",
-        "compression": "75-80% vs JSON",
-        "performance": "30-40% faster parsing than JSON",
-    }
+    return (
+        ("library", "VSON"),
+        ("version", __version__),
+        ("description", "Vesion Snapshot Object Notation"),
+        ("format", "Text-based, CSV-like structure"),
+        ("compression", "75-80% vs JSON"),
+        ("performance", "30-40% faster parsing than JSON"),
+    )
 
 
 # =========================================================================
 # PROFILING AND BENCHMARKING
 # =========================================================================
 
-def profile_encode(data: Dict[str, Any], iterations: int = 10) -> Dict[str, float]:
+def _time_calls(kind: str, payload: Any, iterations: int) -> List[int]:
     """
-    Profile encoding performance
+    Time repeated smart_encode/smart_decode calls
+    
+    One untimed warmup call runs first so imports and interpreter caches
+    are primed before measuring. Module-level so process pools can run it.
     
     Args:
-        data: Data to encode
-        iterations: Number of iterations
+        kind: "encode" or "decode"
+        payload: Data to encode or VSON string to decode
+        iterations: Number of timed calls
     
     Returns:
-        Performance statistics
+        Call durations in nanoseconds
     """
     import time
-    from .core import smart_encode
+    from .core import smart_encode, smart_decode
+    
+    func = smart_encode if kind == "encode" else smart_decode
+    func(payload)
     
     times = []
     for _ in range(iterations):
-        start = time.perf_counter()
-        smart_encode(data)
-        end = time.perf_counter()
-        times.append((end - start) * 1000)  # Convert to ms
+        start = time.perf_counter_ns()
+        func(payload)
+        times.append(time.perf_counter_ns() - start)
+    return times
+
+
+def _profile(kind: str, payload: Any, iterations: int, parallel: bool) -> Dict[str, float]:
+    """Run timings (optionally across processes) and summarize them"""
+    if parallel and iterations > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        workers = min(os.cpu_count() or 1, iterations)
+        shares = [iterations // workers + (i < iterations % workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_time_calls, kind, payload, share) for share in shares]
+            times = [t for future in futures for t in future.result()]
+    else:
+        times = _time_calls(kind, payload, iterations)
+    
+    times_ms = sorted(t / 1e6 for t in times)
+    n = len(times_ms)
+    
+    # Nearest-rank percentiles
+    def percentile(pct: float) -> float:
+        return times_ms[max(math.ceil(pct * n) - 1, 0)]
     
     return {
-        "min_ms": min(times),
-        "max_ms": max(times),
-        "avg_ms": sum(times) / len(times),
-        "total_ms": sum(times),
-        "iterations": iterations,
+        "min_ms": times_ms[0],
+        "max_ms": times_ms[-1],
+        "avg_ms": sum(times_ms) / n,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "total_ms": sum(times_ms),
+        "iterations": n,
     }
 
 
-def profile_decode(vson_str: str, iterations: int = 10) -> Dict[str, float]:
+def profile_encode(
+    data: Dict[str, Any],
+    iterations: int = 10,
+    parallel: bool = False
+) -> Dict[str, float]:
     """
-    Profile decoding performance
+    Profile encoding performance
     
     Args:
-        vson_str: VSON string to decode
-        iterations: Number of iterations
+        data: Data to encode
+        iterations: Number of iterations (after one warmup call)
+        parallel: Spread iterations across worker processes
     
     Returns:
-        Performance statistics
+        Performance statistics (min/max/avg/p50/p99 in ms)
     """
-    import time
-    from .core import smart_decode
+    return _profile("encode", data, iterations, parallel)
+
+
+def profile_decode(
+    vson_str: str,
+    iterations: int = 10,
+    parallel: bool = False
+) -> Dict[str, float]:
+    """
+    Profile decoding performance
     
-    times = []
-    for _ in range(iterations):
-        start = time.perf_counter()
-        smart_decode(vson_str)
-        end = time.perf_counter()
-        times.append((end - start) * 1000)  # Convert to ms
+    Args:
+        vson_str: VSON string to decode
+        iterations: Number of iterations (after one warmup call)
+        parallel: Spread iterations across worker processes
     
-    return {
-        "min_ms": min(times),
-        "max_ms": max(times),
-        "avg_ms": sum(times) / len(times),
-        "total_ms": sum(times),
-        "iterations": iterations,
-    }
+    Returns:
+        Performance statistics (min/max/avg/p50/p99 in ms)
+    """
+    return _profile("decode", vson_str, iterations, parallel)
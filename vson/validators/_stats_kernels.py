@@ -0,0 +1,68 @@
+# vson/validators/_stats_kernels.py
+"""
+Statistics Kernels
+
+Column kernels used by AnomalyDetector. Compiled with Numba when it is
+installed, otherwise the same functions run as vectorized NumPy code.
+Requires NumPy either way; callers check HAS_KERNELS first.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = None
+
+
+HAS_KERNELS = np is not None
+HAS_NUMBA = njit is not None
+
+
+if HAS_KERNELS and HAS_NUMBA:
+
+    @njit(cache=True)
+    def mean_std(values):
+        """Mean and population standard deviation in one pass (Welford)"""
+        mean = 0.0
+        m2 = 0.0
+        for i in range(values.shape[0]):
+            delta = values[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (values[i] - mean)
+        n = values.shape[0]
+        return mean, np.sqrt(m2 / n) if n else 0.0
+
+    @njit(cache=True, parallel=True)
+    def zscore_outliers(values, threshold):
+        """Outlier mask and absolute z-scores (all False/0 when std is 0)"""
+        n = values.shape[0]
+        mask = np.zeros(n, dtype=np.bool_)
+        zscores = np.zeros(n, dtype=np.float64)
+        mean, std = mean_std(values)
+        if std > 0:
+            for i in prange(n):
+                zscores[i] = abs((values[i] - mean) / std)
+                mask[i] = zscores[i] > threshold
+        return mask, zscores
+
+elif HAS_KERNELS:
+
+    def mean_std(values):
+        """Mean and population standard deviation"""
+        if values.shape[0] == 0:
+            return 0.0, 0.0
+        return float(values.mean()), float(values.std())
+
+    def zscore_outliers(values, threshold):
+        """Outlier mask and absolute z-scores (all False/0 when std is 0)"""
+        mean, std = mean_std(values)
+        if not std > 0:
+            n = values.shape[0]
+            return np.zeros(n, dtype=bool), np.zeros(n, dtype=np.float64)
+        zscores = np.abs((values - mean) / std)
+        return zscores > threshold, zscores
@@ -5,9 +5,30 @@ Data Type Validators
 Provides validators for all supported data types.
 """
 
+import re
+import sys
+from functools import lru_cache
+from math import isfinite
 from typing import Any, Tuple, List, Optional
 
 
+# Default for dict.get that no record value can be
+_MISSING = object()
+
+# Shared result for every successful check (avoids a tuple per call)
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+# Fixed-text failures, built once
+_ERR_BOOL_INT: Tuple[bool, Optional[str]] = (False, "Boolean is not valid as int")
+_ERR_BOOL_FLOAT: Tuple[bool, Optional[str]] = (False, "Boolean is not valid as float")
+_ERR_BOOL_VOLUME: Tuple[bool, Optional[str]] = (False, "Boolean not valid as volume")
+
+# ISO 8601 date alone, or date and time (group 1, 'T' or space separated
+# as str(datetime) writes it) followed by optional fractions/offset, e.g.
+# 2023-10-19, 2023-10-19T09:15:00.000+05:30 or 2023-10-19 09:15:00
+_TS_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:([T ]\d{2}:\d{2}:\d{2})|\Z)')
+
+
 class DataTypeValidator:
     """
     Validates data types for VSON format.
@@ -31,16 +52,18 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        # Exact type checks first; isinstance only for subclasses
+        value_type = type(value)
+        if value_type is int or value is None:
+            return _OK
         
-        if isinstance(value, bool):
-            return False, "Boolean is not valid as int"
+        if value_type is bool:
+            return _ERR_BOOL_INT
         
         if not isinstance(value, int):
-            return False, f"Expected int, got {type(value).__name__}"
+            return False, f"Expected int, got {value_type.__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_float(value: Any) -> Tuple[bool, Optional[str]]:
@@ -53,16 +76,17 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        value_type = type(value)
+        if value_type is float or value_type is int or value is None:
+            return _OK
         
-        if isinstance(value, bool):
-            return False, "Boolean is not valid as float"
+        if value_type is bool:
+            return _ERR_BOOL_FLOAT
         
         if not isinstance(value, (int, float)):
-            return False, f"Expected float, got {type(value).__name__}"
+            return False, f"Expected float, got {value_type.__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_string(value: Any) -> Tuple[bool, Optional[str]]:
@@ -75,13 +99,13 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        if type(value) is str or value is None:
+            return _OK
         
         if not isinstance(value, str):
             return False, f"Expected str, got {type(value).__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_bool(value: Any) -> Tuple[bool, Optional[str]]:
@@ -94,13 +118,13 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        if type(value) is bool or value is None:
+            return _OK
         
         if not isinstance(value, bool):
             return False, f"Expected bool, got {type(value).__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_list(value: Any) -> Tuple[bool, Optional[str]]:
@@ -113,13 +137,13 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        if type(value) is list or value is None:
+            return _OK
         
         if not isinstance(value, list):
             return False, f"Expected list, got {type(value).__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_dict(value: Any) -> Tuple[bool, Optional[str]]:
@@ -132,13 +156,13 @@ class DataTypeValidator:
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if value is None:
-            return True, None
+        if type(value) is dict or value is None:
+            return _OK
         
         if not isinstance(value, dict):
             return False, f"Expected dict, got {type(value).__name__}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_timestamp(value: Any) -> Tuple[bool, Optional[str]]:
@@ -155,20 +179,15 @@ class DataTypeValidator:
             Valid: "2023-10-19T09:15:00.000+05:30"
         """
         if value is None:
-            return True, None
+            return _OK
         
         if not isinstance(value, str):
             return False, f"Timestamp must be string, got {type(value).__name__}"
         
-        # Check basic ISO format
-        if not ('T' in value or '-' in value):
+        if _TS_RE.match(value) is None:
             return False, "Invalid timestamp format (expected ISO 8601)"
         
-        # Check for required components
-        if not ('-' in value or ':' in value):
-            return False, "Timestamp missing date or time components"
-        
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_price(value: Any) -> Tuple[bool, Optional[str]]:
@@ -182,15 +201,19 @@ class DataTypeValidator:
             Tuple of (is_valid, error_message)
         """
         if value is None:
-            return True, None
+            return _OK
         
         if not isinstance(value, (int, float)):
             return False, f"Price must be numeric, got {type(value).__name__}"
         
+        # NaN/inf would slip past every later comparison
+        if isinstance(value, float) and not isfinite(value):
+            return False, f"Price must be finite: {value}"
+        
         if value < 0:
             return False, f"Price cannot be negative: {value}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_volume(value: Any) -> Tuple[bool, Optional[str]]:
@@ -204,46 +227,49 @@ class DataTypeValidator:
             Tuple of (is_valid, error_message)
         """
         if value is None:
-            return True, None
-        
-        if isinstance(value, bool):
-            return False, "Boolean not valid as volume"
+            return _OK
         
-        if not isinstance(value, int):
-            return False, f"Volume must be integer, got {type(value).__name__}"
+        value_type = type(value)
+        if value_type is not int:
+            if value_type is bool:
+                return _ERR_BOOL_VOLUME
+            
+            if not isinstance(value, int):
+                return False, f"Volume must be integer, got {value_type.__name__}"
         
         if value < 0:
             return False, f"Volume cannot be negative: {value}"
         
-        return True, None
+        return _OK
     
     @staticmethod
-    def validate_by_type(value: Any, field_type: str) -> Tuple[bool, Optional[str]]:
+    def validate_by_type(
+        value: Any,
+        field_type: str,
+        cached: bool = False
+    ) -> Tuple[bool, Optional[str]]:
         """
         Validate value by type name
         
         Args:
             value: Value to validate
             field_type: Type name (int, float, str, bool, list, dict, etc.)
+            cached: Memoize results per (value, type) for hashable values.
+                Pays off when the same values are validated repeatedly
+                (timestamps, prices); a miss costs more than a plain check.
         
         Returns:
             Tuple of (is_valid, error_message)
         """
-        validators = {
-            'int': DataTypeValidator.validate_int,
-            'float': DataTypeValidator.validate_float,
-            'str': DataTypeValidator.validate_string,
-            'bool': DataTypeValidator.validate_bool,
-            'list': DataTypeValidator.validate_list,
-            'dict': DataTypeValidator.validate_dict,
-            'timestamp': DataTypeValidator.validate_timestamp,
-            'price': DataTypeValidator.validate_price,
-            'volume': DataTypeValidator.validate_volume,
-        }
-        
-        validator = validators.get(field_type)
-        
-        if not validator:
+        if cached:
+            try:
+                return _validate_by_type_cached(value, field_type)
+            except TypeError:  # unhashable value
+                pass
+        
+        validator = _VALIDATORS.get(field_type)
+        
+        if validator is None:
             return False, f"Unknown type: {field_type}"
         
         return validator(value)
@@ -266,7 +292,7 @@ class DataTypeValidator:
             Tuple of (is_valid, error_message)
         """
         if value is None:
-            return True, None
+            return _OK
         
         if not isinstance(value, (int, float)):
             return False, "Range validation requires numeric value"
@@ -277,7 +303,7 @@ class DataTypeValidator:
         if max_value is not None and value > max_value:
             return False, f"Value {value} above maximum {max_value}"
         
-        return True, None
+        return _OK
     
     @staticmethod
     def validate_length(
@@ -297,7 +323,7 @@ class DataTypeValidator:
             Tuple of (is_valid, error_message)
         """
         if value is None:
-            return True, None
+            return _OK
         
         if not isinstance(value, (str, list)):
             return False, "Length validation requires string or list"
@@ -310,7 +336,7 @@ class DataTypeValidator:
         if max_length is not None and length > max_length:
             return False, f"Length {length} above maximum {max_length}"
         
-        return True, None
+        return _OK
 
 
 class TypeConverter:
@@ -347,18 +373,42 @@ class TypeConverter:
     @staticmethod
     def to_type(value: Any, target_type: str) -> Any:
         """Convert value to target type"""
-        converters = {
-            'int': TypeConverter.to_int,
-            'float': TypeConverter.to_float,
-            'str': TypeConverter.to_string,
-            'bool': TypeConverter.to_bool,
-        }
-        
-        converter = converters.get(target_type)
-        if not converter:
+        converter = _CONVERTERS.get(target_type)
+        if converter is None:
             return value
         
         try:
             return converter(value)
         except Exception:
             return value
+
+
+# ============================================================================
+# DISPATCH TABLES
+# ============================================================================
+
+# Built once at import. Type names are interned, so lookups with interned
+# schema type strings hit the identity fast path.
+_VALIDATORS = {
+    sys.intern('int'): DataTypeValidator.validate_int,
+    sys.intern('float'): DataTypeValidator.validate_float,
+    sys.intern('str'): DataTypeValidator.validate_string,
+    sys.intern('bool'): DataTypeValidator.validate_bool,
+    sys.intern('list'): DataTypeValidator.validate_list,
+    sys.intern('dict'): DataTypeValidator.validate_dict,
+    sys.intern('timestamp'): DataTypeValidator.validate_timestamp,
+    sys.intern('price'): DataTypeValidator.validate_price,
+    sys.intern('volume'): DataTypeValidator.validate_volume,
+}
+
+# typed=True keeps equal values of different types (1, 1.0, True) apart
+_validate_by_type_cached = lru_cache(maxsize=65536, typed=True)(
+    DataTypeValidator.validate_by_type
+)
+
+_CONVERTERS = {
+    sys.intern('int'): TypeConverter.to_int,
+    sys.intern('float'): TypeConverter.to_float,
+    sys.intern('str'): TypeConverter.to_string,
+    sys.intern('bool'): TypeConverter.to_bool,
+}
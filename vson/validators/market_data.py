@@ -5,7 +5,56 @@ Market Data Validators
 Specialized validators for trading market data (OHLC, depth, volume, etc.)
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+from functools import lru_cache
+from math import isfinite
+from itertools import compress
+from operator import ge, itemgetter, lt, mul
+from typing import Dict, Any, List, Tuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None
+
+
+from . import _stats_kernels
+from .data_types import _MISSING
+
+
+_OHLC_FIELDS = ('open', 'high', 'low', 'close')
+_OHLC_GET = itemgetter(*_OHLC_FIELDS)
+
+# Error reporting modes of validate_ohlc
+_ERROR_MODES = ('all', 'first', 'none')
+
+
+@lru_cache(maxsize=32)
+def _depth_keys(side: str, levels: int) -> Tuple[Tuple[str, str], ...]:
+    """(qty key, price key) per depth level, e.g. ('bid_qty_1', 'bid_price_1')"""
+    return tuple((f'{side}_qty_{i}', f'{side}_price_{i}') for i in range(1, levels + 1))
+
+
+# Trading session per market as minutes since midnight (open, close)
+_MARKET_HOURS = {
+    'NSE': (9 * 60 + 15, 15 * 60 + 30),
+    'BSE': (9 * 60 + 15, 15 * 60 + 30),
+}
+
+
+@lru_cache(maxsize=4096)
+def _clock_minutes(time_part: str) -> int:
+    """Minutes since midnight for an 'HH:MM:SS' string (cached per value)"""
+    hour, minute, second = map(int, time_part.split(':'))
+    return hour * 60 + minute
+
+
+def _field_floats(records: List[Dict[str, Any]], field: str):
+    """Yield float(record[field]) per record (0 if missing or not numeric)"""
+    for record in records:
+        try:
+            yield float(record.get(field, 0))
+        except (ValueError, TypeError):
+            yield 0
 
 
 class MarketDataValidator:
@@ -21,12 +70,14 @@ class MarketDataValidator:
     """
     
     @staticmethod
-    def validate_ohlc(record: Dict[str, Any]) -> Tuple[bool, List[str]]:
+    def validate_ohlc(record: Dict[str, Any], mode: str = 'all') -> Tuple[bool, List[str]]:
         """
         Validate OHLC data consistency
         
         Args:
             record: Market data record
+            mode: Errors to report: 'all', 'first' (only the first one) or
+                'none' (empty list, no messages are built)
         
         Returns:
             Tuple of (is_valid, errors)
@@ -37,22 +88,32 @@ class MarketDataValidator:
         - Low <= Close <= High
         - All prices > 0
         """
+        if mode not in _ERROR_MODES:
+            raise ValueError(f"Unknown errors mode: {mode}")
+        
         errors = []
         
-        # Check required fields
-        required_fields = ['open', 'high', 'low', 'close']
-        for field in required_fields:
-            if field not in record:
-                errors.append(f"OHLC: Missing '{field}' field")
+        # Check required fields (one lookup per field when all are present)
+        try:
+            prices = _OHLC_GET(record)
+        except KeyError:
+            if mode == 'none':
+                return False, errors
+            for field in _OHLC_FIELDS:
+                if field not in record:
+                    errors.append(f"OHLC: Missing '{field}' field")
+            return False, errors[:1] if mode == 'first' else errors
+        
+        open_p, high_p, low_p, close_p = map(float, prices)
+        
+        # Fast path: one chained comparison covers every rule below (a
+        # positive low with both ranges holding makes all prices positive)
+        if low_p <= open_p <= high_p and low_p <= close_p <= high_p and low_p > 0:
+            return True, []
         
-        if errors:
+        if mode == 'none':
             return False, errors
         
-        open_p = float(record.get('open', 0))
-        high_p = float(record.get('high', 0))
-        low_p = float(record.get('low', 0))
-        close_p = float(record.get('close', 0))
-        
         # Check price relationships
         if not (low_p <= open_p <= high_p):
             errors.append(f"OHLC: Open {open_p} not between low {low_p} and high {high_p}")
@@ -73,7 +134,85 @@ class MarketDataValidator:
         if close_p <= 0:
             errors.append(f"OHLC: Close price must be positive: {close_p}")
         
-        return len(errors) == 0, errors
+        return False, errors[:1] if mode == 'first' else errors
+    
+    @staticmethod
+    def ohlc_columns(records: List[Dict[str, Any]]) -> Tuple[Any, Any, Any, Any]:
+        """
+        Convert OHLC records to open/high/low/close columns
+        
+        Args:
+            records: Market data records (all four fields required)
+        
+        Returns:
+            Tuple of four float64 ndarrays (float lists without numpy)
+        """
+        n = len(records)
+        if np is None:
+            return tuple(
+                [float(record[field]) for record in records] for field in _OHLC_FIELDS
+            )
+        return tuple(
+            np.fromiter((float(record[field]) for record in records), dtype=np.float64, count=n)
+            for field in _OHLC_FIELDS
+        )
+    
+    @staticmethod
+    def validate_ohlc_batch(
+        open_: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float]
+    ) -> Tuple[Any, Dict[int, List[str]]]:
+        """
+        Validate OHLC consistency for whole columns at once
+        
+        Applies the rules of validate_ohlc as array comparisons. Error
+        messages are only built for the rows that fail.
+        
+        Args:
+            open_: Open prices
+            high: High prices
+            low: Low prices
+            close: Close prices
+        
+        Returns:
+            Tuple of (valid mask, errors by row index). The mask is a bool
+            ndarray (a list without numpy); errors match validate_ohlc.
+        """
+        if np is None:
+            valid = []
+            row_errors = {}
+            for i, (open_p, high_p, low_p, close_p) in enumerate(zip(open_, high, low, close)):
+                is_valid, errors = MarketDataValidator.validate_ohlc(
+                    {'open': open_p, 'high': high_p, 'low': low_p, 'close': close_p}
+                )
+                valid.append(is_valid)
+                if errors:
+                    row_errors[i] = errors
+            return valid, row_errors
+        
+        open_p = np.asarray(open_, dtype=np.float64)
+        high_p = np.asarray(high, dtype=np.float64)
+        low_p = np.asarray(low, dtype=np.float64)
+        close_p = np.asarray(close, dtype=np.float64)
+        
+        # Written as negated ranges so NaN fails like the scalar check
+        invalid = ~((low_p <= open_p) & (open_p <= high_p))
+        invalid |= ~((low_p <= close_p) & (close_p <= high_p))
+        invalid |= high_p < low_p
+        invalid |= (open_p <= 0) | (high_p <= 0) | (low_p <= 0) | (close_p <= 0)
+        
+        row_errors = {}
+        for i in np.flatnonzero(invalid).tolist():
+            row_errors[i] = MarketDataValidator.validate_ohlc({
+                'open': open_p.item(i),
+                'high': high_p.item(i),
+                'low': low_p.item(i),
+                'close': close_p.item(i),
+            })[1]
+        
+        return ~invalid, row_errors
     
     @staticmethod
     def validate_depth(record: Dict[str, Any], levels: int = 5) -> Tuple[bool, List[str]]:
@@ -94,60 +233,64 @@ class MarketDataValidator:
         """
         errors = []
         
-        # Check bid levels
-        bid_prices = []
-        for i in range(1, levels + 1):
-            qty_field = f'bid_qty_{i}'
-            price_field = f'bid_price_{i}'
+        best_bid = MarketDataValidator._check_depth_side(record, 'bid', levels, errors)
+        best_ask = MarketDataValidator._check_depth_side(record, 'ask', levels, errors)
+        
+        # Check bid-ask spread (bid < ask)
+        if best_bid is not None and best_ask is not None:
+            if best_bid >= best_ask:
+                errors.append(
+                    f"Depth: bid {best_bid} >= ask {best_ask} (inverted spread)"
+                )
+        
+        return len(errors) == 0, errors
+    
+    @staticmethod
+    def _check_depth_side(
+        record: Dict[str, Any],
+        side: str,
+        levels: int,
+        errors: List[str]
+    ) -> Optional[float]:
+        """
+        Check one side of the book in a single pass over its levels
+        
+        Level errors are appended to errors as they are found, followed by
+        the price ordering errors (bids descending, asks ascending).
+        
+        Returns:
+            Best (first present) price, or None if no level is present
+        """
+        descending = side == 'bid'
+        best = prev = None
+        position = 0
+        unordered = []
+        
+        for qty_field, price_field in _depth_keys(side, levels):
+            qty = record.get(qty_field, _MISSING)
+            price = record.get(price_field, _MISSING)
             
-            if qty_field in record and price_field in record:
-                qty = int(record[qty_field])
-                price = float(record[price_field])
+            if qty is not _MISSING and price is not _MISSING:
+                qty = int(qty)
+                price = float(price)
                 
                 if qty < 0:
-                    errors.append(f"Depth: bid_qty_{i} negative: {qty}")
+                    errors.append(f"Depth: {qty_field} negative: {qty}")
                 
                 if price < 0:
-                    errors.append(f"Depth: bid_price_{i} negative: {price}")
-                
-                bid_prices.append(price)
-        
-        # Check bid prices are descending
-        for i in range(len(bid_prices) - 1):
-            if bid_prices[i] <= bid_prices[i + 1]:
-                errors.append(f"Depth: bid prices not descending at level {i+1}")
-        
-        # Check ask levels
-        ask_prices = []
-        for i in range(1, levels + 1):
-            qty_field = f'ask_qty_{i}'
-            price_field = f'ask_price_{i}'
-            
-            if qty_field in record and price_field in record:
-                qty = int(record[qty_field])
-                price = float(record[price_field])
-                
-                if qty < 0:
-                    errors.append(f"Depth: ask_qty_{i} negative: {qty}")
+                    errors.append(f"Depth: {price_field} negative: {price}")
                 
-                if price < 0:
-                    errors.append(f"Depth: ask_price_{i} negative: {price}")
+                if prev is None:
+                    best = price
+                elif prev <= price if descending else prev >= price:
+                    order = 'descending' if descending else 'ascending'
+                    unordered.append(f"Depth: {side} prices not {order} at level {position}")
                 
-                ask_prices.append(price)
-        
-        # Check ask prices are ascending
-        for i in range(len(ask_prices) - 1):
-            if ask_prices[i] >= ask_prices[i + 1]:
-                errors.append(f"Depth: ask prices not ascending at level {i+1}")
+                prev = price
+                position += 1
         
-        # Check bid-ask spread (bid < ask)
-        if bid_prices and ask_prices:
-            if bid_prices[0] >= ask_prices[0]:
-                errors.append(
-                    f"Depth: bid {bid_prices[0]} >= ask {ask_prices[0]} (inverted spread)"
-                )
-        
-        return len(errors) == 0, errors
+        errors.extend(unordered)
+        return best
     
     @staticmethod
     def validate_volume(record: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -166,18 +309,20 @@ class MarketDataValidator:
         """
         errors = []
         
-        if 'volume' not in record:
+        volume = record.get('volume', _MISSING)
+        if volume is _MISSING:
             return True, []
         
-        volume = record['volume']
-        
         # Check type
         if not isinstance(volume, (int, float)):
             errors.append(f"Volume must be numeric, got {type(volume).__name__}")
         
-        # Check non-negative
-        if float(volume) < 0:
+        # Check non-negative and finite
+        volume_f = float(volume)
+        if volume_f < 0:
             errors.append(f"Volume cannot be negative: {volume}")
+        elif not isfinite(volume_f):
+            errors.append(f"Volume must be finite: {volume}")
         
         return len(errors) == 0, errors
     
@@ -203,11 +348,30 @@ class MarketDataValidator:
         if len(records) < 2:
             return True, []
         
-        prev_timestamp = None
+        timestamps = [record.get('timestamp') for record in records]
         
-        for i, record in enumerate(records):
-            timestamp = record.get('timestamp')
+        # Every timestamp set and truthy: each record is compared with the
+        # one before it, so pairwise C-level compares find all the errors
+        if all(timestamps):
+            following = timestamps[1:]
+            if all(map(lt, timestamps, following)):
+                return True, []
             
+            for i in compress(range(1, len(timestamps)), map(ge, timestamps, following)):
+                timestamp, prev_timestamp = timestamps[i], timestamps[i - 1]
+                if timestamp < prev_timestamp:
+                    errors.append(
+                        f"Record {i}: Timestamp {timestamp} less than "
+                        f"previous {prev_timestamp}"
+                    )
+                elif timestamp == prev_timestamp:
+                    errors.append(f"Record {i}: Duplicate timestamp {timestamp}")
+            
+            return len(errors) == 0, errors
+        
+        prev_timestamp = None
+        
+        for i, timestamp in enumerate(timestamps):
             if timestamp is None:
                 errors.append(f"Record {i}: Missing timestamp")
                 continue
@@ -279,6 +443,82 @@ class MarketDataValidator:
         
         return anomalies
     
+    @staticmethod
+    def detect_anomalies_batch(
+        open_: Sequence[float],
+        high: Sequence[float],
+        low: Sequence[float],
+        close: Sequence[float],
+        volume: Sequence[float]
+    ) -> Tuple[Any, Any, Any, Dict[int, List[str]]]:
+        """
+        Detect anomalies over whole columns at once
+        
+        Same rules as calling detect_anomalies on each record with the
+        previous one; the first row has no previous record and is never
+        flagged. Messages are only built for flagged rows.
+        
+        Args:
+            open_: Open prices
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+        
+        Returns:
+            Tuple of (gap mask, volume spike mask, volatility mask,
+            anomalies by row index). Masks are bool ndarrays (lists
+            without numpy).
+        """
+        def row(i: int) -> Dict[str, float]:
+            return {
+                'open': open_[i], 'high': high[i], 'low': low[i],
+                'close': close[i], 'volume': volume[i],
+            }
+        
+        n = len(close)
+        
+        if np is None:
+            masks = ([False] * n, [False] * n, [False] * n)
+            anomalies = {}
+            for i in range(1, n):
+                found = MarketDataValidator.detect_anomalies(row(i), row(i - 1))
+                if found:
+                    anomalies[i] = found
+                    for mask, prefix in zip(masks, ("Gap", "Volume", "High")):
+                        mask[i] = any(text.startswith(prefix) for text in found)
+            return masks + (anomalies,)
+        
+        open_ = np.asarray(open_, dtype=np.float64)
+        high = np.asarray(high, dtype=np.float64)
+        low = np.asarray(low, dtype=np.float64)
+        close = np.asarray(close, dtype=np.float64)
+        volume = np.asarray(volume, dtype=np.float64)
+        
+        gap = np.zeros(n, dtype=bool)
+        spike = np.zeros(n, dtype=bool)
+        volatile = np.zeros(n, dtype=bool)
+        
+        if n > 1:
+            prev_close = close[:-1]
+            prev_volume = volume[:-1]
+            curr_low = low[1:]
+            
+            # Rows with a zero divisor are masked out, like the scalar guards
+            with np.errstate(divide='ignore', invalid='ignore'):
+                gap[1:] = (prev_close > 0) & (np.abs((open_[1:] - prev_close) / prev_close * 100) > 5)
+                spike[1:] = (prev_volume > 0) & (volume[1:] / prev_volume > 2)
+                volatile[1:] = (curr_low > 0) & ((high[1:] - curr_low) / curr_low * 100 > 10)
+        
+        anomalies = {}
+        for i in np.flatnonzero(gap | spike | volatile).tolist():
+            anomalies[i] = MarketDataValidator.detect_anomalies(
+                {key: value.item() for key, value in row(i).items()},
+                {key: value.item() for key, value in row(i - 1).items()},
+            )
+        
+        return gap, spike, volatile, anomalies
+    
     @staticmethod
     def validate_market_hours(
         timestamp: str,
@@ -299,22 +539,24 @@ class MarketDataValidator:
         - BSE: 09:15 - 15:30 IST
         """
         # Extract time from ISO timestamp
-        if 'T' not in timestamp:
+        t_pos = timestamp.find('T')
+        if t_pos < 0:
             return False, "Invalid timestamp format"
         
-        time_part = timestamp.split('T')[1][:8]  # HH:MM:SS
-        hour, minute, second = map(int, time_part.split(':'))
+        minutes = _clock_minutes(timestamp[t_pos + 1:t_pos + 9])  # HH:MM:SS
         
-        # NSE/BSE hours: 09:15 - 15:30
-        if market.upper() in ('NSE', 'BSE'):
-            if hour < 9 or hour > 15:
-                return False, f"{market} closes outside trading hours"
-            if hour == 9 and minute < 15:
-                return False, f"{market} opens at 09:15"
-            if hour == 15 and minute > 30:
-                return False, f"{market} closes at 15:30"
+        hours = _MARKET_HOURS.get(market.upper())
+        if hours is not None:
+            open_minutes, close_minutes = hours
+            if open_minutes <= minutes <= close_minutes:
+                return True, "Within market hours"
             
-            return True, "Within market hours"
+            hour = minutes // 60
+            if hour < open_minutes // 60 or hour > close_minutes // 60:
+                return False, f"{market} closes outside trading hours"
+            if minutes < open_minutes:
+                return False, f"{market} opens at {open_minutes // 60:02d}:{open_minutes % 60:02d}"
+            return False, f"{market} closes at {close_minutes // 60:02d}:{close_minutes % 60:02d}"
         
         return True, "Market hours validation not configured"
 
@@ -344,29 +586,67 @@ class AnomalyDetector:
         if not records:
             return []
         
-        # Get values
-        values = []
-        for r in records:
-            try:
-                val = float(r.get(field, 0))
-                values.append(val)
-            except (ValueError, TypeError):
-                values.append(0)
+        values = AnomalyDetector._extract_column(records, field)
+        return AnomalyDetector.detect_outliers_columnar(values, threshold)
+    
+    @staticmethod
+    def detect_outliers_columnar(
+        values: Sequence[float],
+        threshold: float = 3.0
+    ) -> List[Tuple[int, Any, float]]:
+        """
+        Detect statistical outliers in a column of values
+        
+        Same as detect_outliers for callers that already hold the column
+        (e.g. from MarketDataValidator.ohlc_columns), skipping the walk
+        over record dicts.
+        
+        Args:
+            values: Numeric values (float64 ndarray or sequence)
+            threshold: Standard deviations (default 3)
+        
+        Returns:
+            List of (index, value, std_devs) tuples
+        """
+        if _stats_kernels.HAS_KERNELS:
+            values = np.asarray(values, dtype=np.float64)
+            mask, zscores = _stats_kernels.zscore_outliers(values, threshold)
+            indices = np.flatnonzero(mask)
+            return list(zip(indices.tolist(), values[indices].tolist(), zscores[indices].tolist()))
+        
+        values = list(values)
         
         if not values:
             return []
         
-        # Calculate statistics
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
+        # Calculate statistics; deviations are computed once and reused for
+        # the variance (C-level sum of squares) and the z-scores
+        n = len(values)
+        mean = sum(values) / n
+        deviations = [x - mean for x in values]
+        variance = sum(map(mul, deviations, deviations)) / n
         std_dev = variance ** 0.5
         
+        if not std_dev > 0:
+            return []
+        
         # Find outliers
         outliers = []
-        for i, val in enumerate(values):
-            if std_dev > 0:
-                z_score = abs((val - mean) / std_dev)
-                if z_score > threshold:
-                    outliers.append((i, val, z_score))
+        for i, deviation in enumerate(deviations):
+            z_score = abs(deviation / std_dev)
+            if z_score > threshold:
+                outliers.append((i, values[i], z_score))
         
         return outliers
+    
+    @staticmethod
+    def _extract_column(records: List[Dict[str, Any]], field: str) -> Any:
+        """
+        Read one numeric field from every record (0 if missing or invalid)
+        
+        Returns:
+            float64 ndarray, or a list without numpy
+        """
+        if _stats_kernels.HAS_KERNELS:
+            return np.fromiter(_field_floats(records, field), dtype=np.float64, count=len(records))
+        return list(_field_floats(records, field))
@@ -5,9 +5,116 @@ Schema Validators
 Validates data against schema definitions.
 """
 
-from typing import Dict, Any, List, Tuple, Optional
+import sys
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Optional, Callable
 
-from .data_types import DataTypeValidator
+from .data_types import DataTypeValidator, _MISSING, _TS_RE, _VALIDATORS
+
+
+# Inferred type names that depend only on the exact value type
+_TYPE_NAMES = {bool: 'bool', int: 'int', float: 'float', list: 'list', dict: 'dict'}
+
+
+def _schema_snapshot(schema: Dict[str, Any]) -> Tuple:
+    """Hashable copy of a schema (field names and sorted definitions)"""
+    return tuple(
+        (field_name, tuple(sorted(field_def.items())))
+        for field_name, field_def in schema.items()
+    )
+
+
+def _unknown_type_validator(field_type: str) -> Callable[[Any], Tuple[bool, Optional[str]]]:
+    """Validator that rejects every value, for type names with no validator"""
+    error = (False, f"Unknown type: {field_type}")
+    
+    def validate(value: Any) -> Tuple[bool, Optional[str]]:
+        return error
+    
+    return validate
+
+
+@lru_cache(maxsize=64)
+def _compile_schema(
+    snapshot: Tuple,
+    strict: bool,
+    stop_on_first_error: bool = False
+) -> Callable[[Dict[str, Any]], Tuple[bool, List[str]]]:
+    """
+    Build the validator closure for one schema
+    
+    Args:
+        snapshot: Schema snapshot from _schema_snapshot
+        strict: Disallow unknown fields
+        stop_on_first_error: Return after the first failing field
+    
+    Returns:
+        Function returning (is_valid, errors) for one record
+    """
+    # One plan per field: (name, required, validator, range/length checks);
+    # fields without bounds get an empty check tuple
+    plans = []
+    for field_name, items in snapshot:
+        field_def = dict(items)
+        
+        field_type = sys.intern(field_def.get('type', 'str'))
+        validator = _VALIDATORS.get(field_type) or _unknown_type_validator(field_type)
+        
+        checks = []
+        if 'min_value' in field_def or 'max_value' in field_def:
+            checks.append((
+                DataTypeValidator.validate_range,
+                field_def.get('min_value'), field_def.get('max_value'),
+            ))
+        if 'min_length' in field_def or 'max_length' in field_def:
+            checks.append((
+                DataTypeValidator.validate_length,
+                field_def.get('min_length'), field_def.get('max_length'),
+            ))
+        
+        plans.append((field_name, field_def.get('required', False), validator, tuple(checks)))
+    plans = tuple(plans)
+    
+    known_fields = frozenset(field_name for field_name, _ in snapshot)
+    
+    def validate(data: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        errors = []
+        get = data.get
+        
+        for field_name, required, validator, checks in plans:
+            value = get(field_name, _MISSING)
+            
+            if value is _MISSING:
+                if required:
+                    errors.append(f"Required field '{field_name}' missing")
+                    if stop_on_first_error:
+                        return False, errors
+                continue
+            
+            if required and (value is None or value == ''):
+                errors.append(f"Required field '{field_name}' is empty")
+            
+            is_valid, error = validator(value)
+            if not is_valid:
+                errors.append(f"Field '{field_name}': {error}")
+            
+            for check, low, high in checks:
+                is_valid, error = check(value, low, high)
+                if not is_valid:
+                    errors.append(f"Field '{field_name}': {error}")
+            
+            if stop_on_first_error and errors:
+                return False, errors[:1]
+        
+        if strict:
+            unknown = data.keys() - known_fields
+            if unknown:
+                errors.append(f"Unknown fields: {', '.join(unknown)}")
+        
+        return len(errors) == 0, errors
+    
+    return validate
 
 
 class SchemaValidator:
@@ -39,9 +146,10 @@ class SchemaValidator:
         
         for field_name, field_def in schema.items():
             if field_def.get('required', False):
-                if field_name not in data:
+                value = data.get(field_name, _MISSING)
+                if value is _MISSING:
                     errors.append(f"Required field '{field_name}' missing")
-                elif data[field_name] is None or data[field_name] == '':
+                elif value is None or value == '':
                     errors.append(f"Required field '{field_name}' is empty")
         
         return len(errors) == 0, errors
@@ -64,10 +172,9 @@ class SchemaValidator:
         errors = []
         
         for field_name, field_def in schema.items():
-            if field_name not in data:
+            value = data.get(field_name, _MISSING)
+            if value is _MISSING:
                 continue
-            
-            value = data[field_name]
             expected_type = field_def.get('type', 'str')
             
             is_valid, error = DataTypeValidator.validate_by_type(value, expected_type)
@@ -95,11 +202,10 @@ class SchemaValidator:
         errors = []
         
         for field_name, field_def in schema.items():
-            if field_name not in data:
+            value = data.get(field_name, _MISSING)
+            if value is _MISSING:
                 continue
             
-            value = data[field_name]
-            
             # Range check
             if 'min_value' in field_def or 'max_value' in field_def:
                 is_valid, error = DataTypeValidator.validate_range(
@@ -139,9 +245,7 @@ class SchemaValidator:
         """
         errors = []
         
-        known_fields = set(schema.keys())
-        data_fields = set(data.keys())
-        unknown = data_fields - known_fields
+        unknown = data.keys() - schema.keys()
         
         if unknown:
             errors.append(f"Unknown fields: {', '.join(unknown)}")
@@ -152,32 +256,70 @@ class SchemaValidator:
     def validate_complete(
         data: Dict[str, Any],
         schema: Dict[str, Any],
-        strict: bool = False
+        strict: bool = False,
+        stop_on_first_error: bool = False
     ) -> Tuple[bool, List[str]]:
         """
         Complete schema validation
         
+        Errors are reported field by field, in schema order.
+        
         Args:
             data: Data to validate
             schema: Schema definition
             strict: Disallow unknown fields
+            stop_on_first_error: Return after the first failing field, with
+                only its first error (for pass/fail callers)
         
         Returns:
             Tuple of (is_valid, errors)
         """
         all_errors = []
         
-        # Check required fields
-        _, errors = SchemaValidator.validate_required_fields(data, schema)
-        all_errors.extend(errors)
-        
-        # Check field types
-        _, errors = SchemaValidator.validate_field_types(data, schema)
-        all_errors.extend(errors)
-        
-        # Check constraints
-        _, errors = SchemaValidator.validate_field_constraints(data, schema)
-        all_errors.extend(errors)
+        # One pass over the schema: required, type and constraint checks
+        # per field, in that order
+        for field_name, field_def in schema.items():
+            value = data.get(field_name, _MISSING)
+            required = field_def.get('required', False)
+            
+            if value is _MISSING:
+                if required:
+                    all_errors.append(f"Required field '{field_name}' missing")
+                    if stop_on_first_error:
+                        return False, all_errors
+                continue
+            
+            if required and (value is None or value == ''):
+                all_errors.append(f"Required field '{field_name}' is empty")
+            
+            is_valid, error = DataTypeValidator.validate_by_type(
+                value, field_def.get('type', 'str')
+            )
+            if not is_valid:
+                all_errors.append(f"Field '{field_name}': {error}")
+            
+            # Range check
+            if 'min_value' in field_def or 'max_value' in field_def:
+                is_valid, error = DataTypeValidator.validate_range(
+                    value,
+                    min_value=field_def.get('min_value'),
+                    max_value=field_def.get('max_value')
+                )
+                if not is_valid:
+                    all_errors.append(f"Field '{field_name}': {error}")
+            
+            # Length check
+            if 'min_length' in field_def or 'max_length' in field_def:
+                is_valid, error = DataTypeValidator.validate_length(
+                    value,
+                    min_length=field_def.get('min_length'),
+                    max_length=field_def.get('max_length')
+                )
+                if not is_valid:
+                    all_errors.append(f"Field '{field_name}': {error}")
+            
+            if stop_on_first_error and all_errors:
+                return False, all_errors[:1]
         
         # Check unknown fields if strict
         if strict:
@@ -185,6 +327,36 @@ class SchemaValidator:
             all_errors.extend(errors)
         
         return len(all_errors) == 0, all_errors
+    
+    @staticmethod
+    def compile(
+        schema: Dict[str, Any],
+        strict: bool = False,
+        stop_on_first_error: bool = False
+    ) -> Callable[[Dict[str, Any]], Tuple[bool, List[str]]]:
+        """
+        Compile a schema into a reusable validator
+        
+        The schema is walked once up front, so validating a stream of
+        records skips the per-record schema lookups of validate_complete.
+        Compiled validators are cached by schema contents.
+        
+        Args:
+            schema: Schema definition
+            strict: Disallow unknown fields
+            stop_on_first_error: Return after the first failing field
+        
+        Returns:
+            Function taking a record and returning (is_valid, errors), same
+            as validate_complete(record, schema, strict, stop_on_first_error)
+        """
+        snapshot = _schema_snapshot(schema)
+        
+        try:
+            return _compile_schema(snapshot, strict, stop_on_first_error)
+        except TypeError:
+            # Unhashable constraint values: compile without caching
+            return _compile_schema.__wrapped__(snapshot, strict, stop_on_first_error)
 
 
 class SchemaInferencer:
@@ -200,6 +372,9 @@ class SchemaInferencer:
         """
         Infer schema from data records
         
+        Covers every field seen in any record; each field gets the type
+        inferred for most of its non-None values.
+        
         Args:
             records: List of data records
             auto_required: Mark fields required if in all records
@@ -211,23 +386,26 @@ class SchemaInferencer:
             return {}
         
         schema = {}
-        field_counts = {}
+        field_counts = Counter()
+        type_counts = defaultdict(Counter)
         total_records = len(records)
         
-        # Count field occurrences
+        # One pass: field occurrences and inferred type votes (None values
+        # carry no type information and do not vote)
         for record in records:
-            for key in record.keys():
-                field_counts[key] = field_counts.get(key, 0) + 1
-        
-        # Build schema from first record
-        first_record = records[0]
+            field_counts.update(record.keys())
+            for key, value in record.items():
+                if value is None:
+                    continue
+                field_type = _TYPE_NAMES.get(type(value)) or SchemaInferencer._infer_type(value)
+                type_counts[key][field_type] += 1
         
-        for key, value in first_record.items():
-            # Infer type
-            field_type = SchemaInferencer._infer_type(value)
+        # Fields in order of first appearance, typed by majority
+        for key, count in field_counts.items():
+            votes = type_counts.get(key)
+            field_type = votes.most_common(1)[0][0] if votes else 'str'
             
             # Check if required
-            count = field_counts.get(key, 0)
             required = auto_required and count == total_records
             
             schema[key] = {
@@ -248,8 +426,9 @@ class SchemaInferencer:
         elif isinstance(value, float):
             return 'float'
         elif isinstance(value, str):
-            # Check if timestamp-like
-            if 'T' in value or '-' in value and ':' in value:
+            # Timestamp-like only with a time part (date-only values stay str)
+            match = _TS_RE.match(value)
+            if match is not None and match.group(1) is not None:
                 return 'timestamp'
             return 'str'
         elif isinstance(value, list):